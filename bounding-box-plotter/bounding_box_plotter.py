@@ -1,11 +1,15 @@
 import sys
 import subprocess
 import importlib
+import importlib.util
 import os
 
 # Set matplotlib backend before importing matplotlib to prevent segmentation faults
 os.environ['MPLBACKEND'] = 'TkAgg'
 
+# Set once the dependency check has passed so later calls in the same process skip it
+_deps_checked = False
+
 def install_package(package):
     """Install a package using pip"""
     try:
@@ -18,6 +22,10 @@ def install_package(package):
 
 def check_and_install_dependencies():
     """Check and install required dependencies"""
+    global _deps_checked
+    if _deps_checked:
+        return True
+    
     required_packages = {
         'pandas': 'pandas',
         'matplotlib': 'matplotlib',
@@ -36,11 +44,11 @@ def check_and_install_dependencies():
     
     missing_packages = []
     
+    # find_spec only locates the package; the real (slow) import happens once below
     for module_name, package_name in required_packages.items():
-        try:
-            importlib.import_module(module_name)
+        if importlib.util.find_spec(module_name) is not None:
             print(f"✓ {module_name} is already installed")
-        except ImportError:
+        else:
             print(f"✗ {module_name} is not installed. Installing...")
             missing_packages.append((module_name, package_name))
     
@@ -52,27 +60,14 @@ def check_and_install_dependencies():
             print(f"✗ Failed to install {package_name}. Please install manually: pip install {package_name}")
             return False
     
-    # Re-import matplotlib if it was installed
-    if 'matplotlib' in [pkg[1] for pkg in missing_packages if pkg[1] == 'matplotlib']:
-        try:
-            import matplotlib
-            matplotlib.use('TkAgg')
-            import matplotlib.pyplot as plt
-            import matplotlib.patches as patches
-            from matplotlib.widgets import Button, RadioButtons, Slider
-            from matplotlib import gridspec
-            from matplotlib.transforms import Bbox
-            from matplotlib import image as mpimg
-            print("✓ matplotlib re-imported successfully after installation")
-        except Exception as e:
-            print(f"✗ Failed to re-import matplotlib after installation: {e}")
-            return False
+    # Make freshly installed packages visible to the import system
+    if missing_packages:
+        importlib.invalidate_caches()
     
     # Check tkinter (built-in on most systems)
-    try:
-        import tkinter
+    if importlib.util.find_spec('tkinter') is not None:
         print("✓ tkinter is available")
-    except ImportError:
+    else:
         print("✗ tkinter is not available. This may cause issues with file dialogs.")
         print("On some systems, you may need to install python3-tk package.")
     
@@ -83,6 +78,7 @@ def check_and_install_dependencies():
     print("  • material-icons: pip install material-icons")
     print("  • feather-icons: pip install feather-icons")
     
+    _deps_checked = True
     return True
 
 # Check and install dependencies before importing
@@ -93,57 +89,75 @@ if not check_and_install_dependencies():
 
 print("All dependencies are ready!")
 
-# Import matplotlib with error handling
+# Import matplotlib once, falling back to the non-interactive backend if TkAgg is unusable
 try:
     import matplotlib
-    matplotlib.use('TkAgg')  # Force TkAgg backend
-    import matplotlib.pyplot as plt
-    import matplotlib.patches as patches
-    from matplotlib.widgets import Button, RadioButtons, Slider
-    from matplotlib import gridspec
-    from matplotlib.transforms import Bbox
-    from matplotlib import image as mpimg
-    print("✓ matplotlib imported successfully with TkAgg backend")
-except Exception as e:
-    print(f"✗ Error importing matplotlib: {e}")
-    print("Trying alternative backend...")
     try:
-        import matplotlib
+        matplotlib.use('TkAgg')  # Force TkAgg backend
+        import matplotlib.pyplot as plt
+        print("✓ matplotlib imported successfully with TkAgg backend")
+    except Exception as e:
+        print(f"✗ Error importing matplotlib: {e}")
+        print("Trying alternative backend...")
         matplotlib.use('Agg')  # Fallback to non-interactive backend
         import matplotlib.pyplot as plt
-        import matplotlib.patches as patches
-        from matplotlib.widgets import Button, RadioButtons, Slider
-        from matplotlib import gridspec
-        from matplotlib.transforms import Bbox
-        from matplotlib import image as mpimg
         print("✓ matplotlib imported with Agg backend (non-interactive)")
-    except Exception as e2:
-        print(f"✗ Failed to import matplotlib: {e2}")
-        print("Matplotlib will be installed by the dependency checker")
-        # Set placeholder variables to prevent errors
-        plt = None
-        patches = None
-        Button = None
-        RadioButtons = None
-        Slider = None
-        gridspec = None
-        Bbox = None
-        mpimg = None
+    from matplotlib.widgets import Button, RadioButtons, Slider
+    from matplotlib import gridspec
+    from matplotlib.transforms import Bbox, Affine2D, IdentityTransform
+    from matplotlib.textpath import TextPath
+    from matplotlib.markers import MarkerStyle
+    from matplotlib import image as mpimg
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.collections import PolyCollection, PathCollection
+    from matplotlib.font_manager import FontProperties
+except Exception as e2:
+    print(f"✗ Failed to import matplotlib: {e2}")
+    print("Matplotlib will be installed by the dependency checker")
+    # Set placeholder variables to prevent errors
+    plt = None
+    Button = None
+    RadioButtons = None
+    Slider = None
+    gridspec = None
+    Bbox = None
+    Affine2D = None
+    IdentityTransform = None
+    TextPath = None
+    MarkerStyle = None
+    mpimg = None
+    Figure = None
+    FigureCanvasAgg = None
+    PolyCollection = None
+    PathCollection = None
+    FontProperties = None
 
 import numpy as np
 import pandas as pd
+
+# Optional fast CSV reader (falls back to pandas' own parser when unavailable)
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
 import webbrowser
-import requests
-from PIL import Image
 import io
+import re
 
 import tkinter as tk
-from tkinter import filedialog, messagebox, font as tkFont
+from tkinter import filedialog, messagebox
 from datetime import datetime
 import logging
+import logging.handlers
 import json
 import tempfile
 import shutil
+import threading
+import functools
+import traceback
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # --- Annotation state for undo/redo/clear, per image_id ---
 class AnnotationState:
@@ -155,9 +169,19 @@ class AnnotationState:
         self.mode = 'x'
         self.hover_text = None  # Store hover text per image
         self.image_url = None  # Store image URL for this image_id
+        self.bounds = None  # Cached (x_mins, y_mins, x_maxs, y_maxs) arrays for this image_id
+        self.centers = None  # Cached (centers_x, centers_y) arrays, aligned with bounds
+        self.box_index = None  # Lazily built R-tree over bounds (False when not used)
+        self.hover_labels = None  # Cached hover text per box, aligned with bounds
     
     def reset(self):
         self.annotations.clear()
+        # Group artists are shared by several entries, so remove each one once
+        for marker in dict.fromkeys(m[0] for m in self.markers):
+            try:
+                marker.remove()
+            except (NotImplementedError, ValueError):
+                pass
         self.markers.clear()
         self.undone.clear()
         if self.hover_text:
@@ -167,115 +191,616 @@ class AnnotationState:
                 pass
             self.hover_text = None
 
+# --- Bounded cache for background images ---
+class ImageLRU:
+    """url -> image array cache that evicts the least recently used images beyond max_bytes"""
+    def __init__(self, max_bytes=512 << 20):
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self._images = OrderedDict()
+        # Fetch workers store finished downloads while the GUI thread reads
+        self._lock = threading.RLock()
+    
+    def __contains__(self, url):
+        with self._lock:
+            return url in self._images
+    
+    def __len__(self):
+        with self._lock:
+            return len(self._images)
+    
+    def get(self, url, default=None):
+        with self._lock:
+            if url not in self._images:
+                return default
+            self._images.move_to_end(url)
+            return self._images[url]
+    
+    def put(self, url, img_array):
+        # Failed loads are cached as None so they aren't retried on every redraw
+        with self._lock:
+            self.invalidate(url)
+            self._images[url] = img_array
+            self.total_bytes += img_array.nbytes if img_array is not None else 0
+            while self.total_bytes > self.max_bytes and len(self._images) > 1:
+                _, evicted = self._images.popitem(last=False)
+                self.total_bytes -= evicted.nbytes if evicted is not None else 0
+    
+    def invalidate(self, url):
+        with self._lock:
+            evicted = self._images.pop(url, None)
+            self.total_bytes -= evicted.nbytes if evicted is not None else 0
+    
+    def clear(self):
+        with self._lock:
+            self._images.clear()
+            self.total_bytes = 0
+
 # --- Generate thumbnails for each image ---
-def generate_thumbnail(df_selected):
+def generate_thumbnail(df_selected, flipped=None, size=250):
     """Generate a thumbnail image for the given DataFrame selection"""
+    # Rasterized straight into a Pillow image: a matplotlib figure per thumbnail costs far more
+    # than drawing the boxes, and plain Pillow drawing is safe to run from worker threads
+    from PIL import Image, ImageDraw, ImageFont
+    if flipped is None:
+        flipped = y_axis_flipped[0]
+    img = Image.new('RGB', (size, size), (255, 255, 255))  # Thumbnails never need alpha
+    
     # Skip if df_selected is empty or all bounding box columns are NaN
     if df_selected.empty or df_selected['x_min'].isna().all() or df_selected['x_max'].isna().all() or df_selected['y_min'].isna().all() or df_selected['y_max'].isna().all():
         print(f"[Warning] Skipping thumbnail: No valid bounding box data for image_id: {df_selected['image_id'].iloc[0] if not df_selected.empty else 'N/A'}")
-        fig, ax = plt.subplots(figsize=(2.5, 2.5))
-        ax.axis('off')
-        fig.canvas.draw()
-        img = np.array(fig.canvas.renderer.buffer_rgba())
-        plt.close(fig)
-        return img
-    
-    # Apply quality settings - but maintain consistent thumbnail size
+        return np.asarray(img)
+    
+    # Apply quality settings - but maintain consistent thumbnail size (pixel sizes match the old 100 dpi figure)
     if global_settings.get('high_quality_thumbnails', True):
-        figsize = (2.5, 2.5)  # Keep consistent size regardless of quality
-        linewidth = 1.2
-        fontsize = 9
-        marker_size = 10
+        linewidth = 2
+        fontsize = 12
+        marker_size = 14
     else:
-        figsize = (2.5, 2.5)  # Keep consistent size regardless of quality
-        linewidth = 0.8
-        fontsize = 7
-        marker_size = 8
-    
-    fig, ax = plt.subplots(figsize=figsize)
-    
-    for _, row in df_selected.dropna(subset=['x_min', 'x_max', 'y_min', 'y_max']).iterrows():
-        rect = patches.Rectangle(
-            (row['x_min'], row['y_min']),
-            row['x_max'] - row['x_min'],
-            row['y_max'] - row['y_min'],
-            linewidth=linewidth,
-            edgecolor='r',
-            facecolor='none',
-            zorder=1  # Low z-order so markers appear on top
-        )
-        ax.add_patch(rect)
-        
-        # Add existing marks from CSV 'marked' column to thumbnails
-        if 'marked' in df.columns:
-            marked_value = str(row.get('marked', '')).strip()
-            if marked_value and marked_value.lower() != 'nan' and marked_value.lower() != '':
-                x, y = (row['x_min'] + row['x_max']) / 2, (row['y_min'] + row['y_max']) / 2
-                
-                # Convert "yes" to "x" for display
-                if marked_value.lower() == 'yes':
-                    display_value = 'x'
-                    marker_color = 'green'
-                    # Display as X marker with high z-order
-                    ax.plot(x, y, marker='x', color=marker_color, markersize=marker_size, mew=1, zorder=10)
-                else:
-                    display_value = marked_value
-                    marker_color = 'purple'
-                    # Display as text (no X marker) with high z-order
-                    ax.text(x, y, display_value, color=marker_color, fontsize=fontsize, 
-                           ha='center', va='center', zorder=10)
-    
-    ax.set_xlim(df_selected['x_min'].min()-10, df_selected['x_max'].max()+10)
+        linewidth = 1
+        fontsize = 10
+        marker_size = 11
+    
+    x_mins, y_mins, x_maxs, y_maxs = box_bounds(df_selected)
+    valid = np.isfinite(x_mins) & np.isfinite(y_mins) & np.isfinite(x_maxs) & np.isfinite(y_maxs)
+    
+    # Same view as the main plot: 10 units of padding around the boxes, y down when flipped
+    left, right = np.nanmin(x_mins) - 10, np.nanmax(x_maxs) + 10
+    bottom, top = np.nanmin(y_mins) - 10, np.nanmax(y_maxs) + 10
+    x_scale = (size - 1) / max(right - left, 1e-9)
+    y_scale = (size - 1) / max(top - bottom, 1e-9)
+    
+    def to_pixels(xs, ys):
+        px = (xs - left) * x_scale
+        py = (ys - bottom) * y_scale if flipped else (top - ys) * y_scale
+        return np.rint(px).astype(np.int32), np.rint(py).astype(np.int32)
+    
+    px0, py0 = to_pixels(x_mins[valid], y_mins[valid])
+    px1, py1 = to_pixels(x_maxs[valid], y_maxs[valid])
+    draw = ImageDraw.Draw(img)
+    for box in zip(np.minimum(px0, px1), np.minimum(py0, py1), np.maximum(px0, px1), np.maximum(py0, py1)):
+        draw.rectangle(box, outline=(255, 0, 0), width=linewidth)
+    
+    # Add existing marks from CSV 'marked' column to thumbnails
+    if 'marked' in df.columns:
+        marked_values = df_selected['marked'].astype(str).str.strip().to_numpy()[valid]
+        centers_x, centers_y = to_pixels((x_mins[valid] + x_maxs[valid]) / 2, (y_mins[valid] + y_maxs[valid]) / 2)
+        font = None
+        for marked_value, x, y in zip(marked_values, centers_x, centers_y):
+            if not marked_value or marked_value.lower() == 'nan':
+                continue
+            
+            # Convert "yes" to "x" for display
+            if marked_value.lower() == 'yes':
+                # Display as a green X marker
+                half = marker_size // 2
+                draw.line((x - half, y - half, x + half, y + half), fill=(0, 128, 0), width=1)
+                draw.line((x - half, y + half, x + half, y - half), fill=(0, 128, 0), width=1)
+            else:
+                # Display as purple text centered on the box
+                if font is None:
+                    try:
+                        font = ImageFont.load_default(size=fontsize)
+                    except TypeError:
+                        font = ImageFont.load_default()  # Pillow < 10.1 has a single bitmap size
+                text_box = draw.textbbox((0, 0), marked_value, font=font)
+                draw.text((x - (text_box[0] + text_box[2]) / 2, y - (text_box[1] + text_box[3]) / 2),
+                          marked_value, fill=(128, 0, 128), font=font)
+    
+    return np.asarray(img)
+
+def box_bounds(df_selected):
+    """Return the (x_mins, y_mins, x_maxs, y_maxs) float arrays of df_selected"""
+    return tuple(df_selected[col].to_numpy(dtype=float) for col in ('x_min', 'y_min', 'x_max', 'y_max'))
+
+@functools.lru_cache(maxsize=1)
+def get_points_in_boxes_kernel():
+    """Compile the point-in-box test with Numba when it's installed, otherwise return None"""
+    try:
+        import numba
+    except ImportError:
+        return None
     
-    # Apply Y-axis flip if enabled
-    if y_axis_flipped[0]:
-        ax.set_ylim(df_selected['y_max'].max()+10, df_selected['y_min'].min()-10)
-    else:
-        ax.set_ylim(df_selected['y_min'].min()-10, df_selected['y_max'].max()+10)
+    @numba.njit(cache=True, parallel=True)
+    def points_in_boxes_kernel(xs, ys, x_mins, y_mins, x_maxs, y_maxs):
+        inside = np.zeros(xs.size, dtype=np.bool_)
+        for i in numba.prange(xs.size):
+            for j in range(x_mins.size):
+                if x_mins[j] <= xs[i] <= x_maxs[j] and y_mins[j] <= ys[i] <= y_maxs[j]:
+                    inside[i] = True
+                    break
+        return inside
+    return points_in_boxes_kernel
+
+@functools.lru_cache(maxsize=1)
+def get_box_at_kernel():
+    """Compile the first-containing-box search with Numba when it's installed, otherwise return None"""
+    try:
+        import numba
+    except ImportError:
+        return None
     
-    ax.axis('off')
-    fig.canvas.draw()
-    img = np.array(fig.canvas.renderer.buffer_rgba())
-    plt.close(fig)
-    return img
+    @numba.njit(cache=True)
+    def box_at_kernel(x_mins, y_mins, x_maxs, y_maxs, x, y):
+        for i in range(x_mins.size):
+            if x_mins[i] <= x <= x_maxs[i] and y_mins[i] <= y <= y_maxs[i]:
+                return i
+        return -1
+    return box_at_kernel
+
+def points_in_boxes(xs, ys, bounds):
+    """Return a bool per point telling whether it lies inside any of the boxes in bounds"""
+    x_mins, y_mins, x_maxs, y_maxs = bounds
+    # Broadcasting allocates points x boxes flags; past that size a compiled loop is cheaper
+    if xs.size * x_mins.size > 100_000:
+        kernel = get_points_in_boxes_kernel()
+        if kernel is not None:
+            return kernel(xs, ys, x_mins, y_mins, x_maxs, y_maxs)
+    xs, ys = xs[:, None], ys[:, None]
+    return ((x_mins <= xs) & (xs <= x_maxs) & (y_mins <= ys) & (ys <= y_maxs)).any(axis=1)
+
+def build_hover_labels(frame):
+    """Return the hover text of every row in frame: one 'name: value' line per non-empty label column"""
+    columns = []
+    for label_col in label_columns:
+        values = frame[label_col].astype(str)
+        keep = frame[label_col].notna() & (values.str.strip() != '') & (values.str.lower() != 'nan')
+        lines = (label_col.replace('label_', '') + ': ' + values).to_numpy(dtype=object)
+        columns.append(np.where(keep.to_numpy(), lines, ''))
+    if not columns:
+        return np.full(len(frame), '', dtype=object)
+    return np.array(['\n'.join(line for line in lines if line) for lines in zip(*columns)], dtype=object)
+
+def get_box_index(state):
+    """Return an R-tree over the image's boxes when it has enough of them and rtree is installed, else None"""
+    if state.box_index is None:
+        state.box_index = False  # Built (or ruled out) once per image
+        x_mins, y_mins, x_maxs, y_maxs = state.bounds
+        # Below this many boxes a linear NumPy scan beats the tree query overhead
+        if x_mins.size >= 256:
+            try:
+                from rtree import index
+                valid = np.flatnonzero(np.isfinite(x_mins) & np.isfinite(y_mins) & np.isfinite(x_maxs) &
+                                       np.isfinite(y_maxs) & (x_mins <= x_maxs) & (y_mins <= y_maxs))
+                if len(valid):
+                    state.box_index = index.Index(
+                        (int(i), (x_mins[i], y_mins[i], x_maxs[i], y_maxs[i]), None) for i in valid)
+            except ImportError:
+                pass
+    return state.box_index if state.box_index is not False else None
+
+def box_at(state, x, y):
+    """Return the position of the first of the image's boxes that contains (x, y), or None"""
+    box_index = get_box_index(state)
+    if box_index is not None:
+        # The tree returns matches in no particular order; keep the first-row-wins rule
+        hits = list(box_index.intersection((x, y, x, y)))
+        return min(hits) if hits else None
+    
+    x_mins, y_mins, x_maxs, y_maxs = state.bounds
+    # Very dense images without rtree: a compiled loop stops at the first hit and allocates nothing
+    if x_mins.size >= 100_000:
+        kernel = get_box_at_kernel()
+        if kernel is not None:
+            hit = kernel(x_mins, y_mins, x_maxs, y_maxs, float(x), float(y))
+            return int(hit) if hit >= 0 else None
+    hits = (x_mins <= x) & (x <= x_maxs) & (y_mins <= y) & (y <= y_maxs)
+    return int(hits.argmax()) if hits.any() else None
+
+def add_box_collection(ax, bounds, linewidth):
+    """Draw every bounding box in bounds as one red-outlined PolyCollection"""
+    x0, y0, x1, y1 = bounds
+    
+    # Rows with missing coordinates have no box to draw
+    valid = np.isfinite(x0) & np.isfinite(y0) & np.isfinite(x1) & np.isfinite(y1)
+    x0, y0, x1, y1 = x0[valid], y0[valid], x1[valid], y1[valid]
+    
+    # (N, 4, 2) corners: bottom-left, bottom-right, top-right, top-left
+    verts = np.stack([np.column_stack((x0, y0)), np.column_stack((x1, y0)),
+                      np.column_stack((x1, y1)), np.column_stack((x0, y1))], axis=1)
+    boxes = PolyCollection(verts, closed=True, facecolors='none', edgecolors='r',
+                           linewidths=linewidth, zorder=1)  # Low z-order so markers appear on top
+    ax.add_collection(boxes, autolim=False)
+    return boxes
+
+@functools.lru_cache(maxsize=1024)
+def get_number_marker(mark_value):
+    """Return a cached, centered TextPath marker for a number annotation (avoids mathtext parsing)"""
+    path = TextPath((0, 0), str(mark_value), size=10)
+    extents = path.get_extents()
+    return path.transformed(Affine2D().translate(-(extents.x0 + extents.width / 2),
+                                                 -(extents.y0 + extents.height / 2)))
+
+def scatter_number_markers(ax, xs, ys, mark_values, markersize, color='red'):
+    """Draw all number annotations as a single PathCollection with one glyph path per point"""
+    paths = []
+    for mark_value in mark_values:
+        style = MarkerStyle(get_number_marker(mark_value))
+        paths.append(style.get_path().transformed(style.get_transform()))
+    collection = ax.scatter(xs, ys, marker=get_number_marker(mark_values[0]), s=markersize ** 2,
+                            c=color, linewidths=2)
+    collection.set_paths(paths)
+    return collection
+
+@functools.lru_cache(maxsize=1024)
+def get_text_glyph(text, fontsize, weight):
+    """Return a cached TextPath for text in points, centered on the origin"""
+    path = TextPath((0, 0), text, size=fontsize, prop=FontProperties(weight=weight))
+    extents = path.get_extents()
+    return path.transformed(Affine2D().translate(-(extents.x0 + extents.width / 2),
+                                                 -(extents.y0 + extents.height / 2)))
+
+def add_text_glyphs(ax, xs, ys, texts, fontsize, color, weight='normal', zorder=10):
+    """Draw many short strings as one PathCollection, each glyph kept at fontsize however long the string is"""
+    paths = [get_text_glyph(str(text), fontsize, weight) for text in texts]
+    # Unlike scatter markers (normalized to unit size), sizes=1 maps path units straight to points
+    glyphs = PathCollection(paths, sizes=[1.0], offsets=np.column_stack((xs, ys)), offset_transform=ax.transData,
+                            facecolors=color, edgecolors='none', zorder=zorder)
+    glyphs.set_transform(IdentityTransform())
+    ax.add_collection(glyphs, autolim=False)
+    return glyphs
+
+def get_image_df(img_id):
+    """Return the rows of the loaded DataFrame that belong to img_id"""
+    return df.iloc[image_row_indices[img_id]]
+
+def get_image_index(img_id):
+    """Return the DataFrame index labels of img_id's rows without building a sub-frame"""
+    return df.index[image_row_indices[img_id]]
+
+def render_thumbnail_async(img_id):
+    """Return the Future rendering img_id's thumbnail in the current orientation, starting it only if needed"""
+    key = (img_id, y_axis_flipped[0])
+    future = pending_thumbnails.get(key)
+    if future is None:
+        # Rows are sliced on this thread; the worker only rasterizes with Pillow
+        future = pending_thumbnails[key] = thumbnail_render_pool.submit(generate_thumbnail, get_image_df(img_id), key[1])
+    return future
+
+def get_thumbnail(img_id, wait=True):
+    """Return img_id's thumbnail in the current orientation, or None when wait is False and it isn't rendered yet"""
+    key = (img_id, y_axis_flipped[0])
+    thumb = thumbnail_cache.get(key)
+    if thumb is None:
+        future = render_thumbnail_async(img_id)
+        if not wait and not future.done():
+            return None
+        pending_thumbnails.pop(key, None)
+        try:
+            thumb = future.result()
+        except Exception as e:
+            print(f"✗ Error creating thumbnail for {img_id}: {e}")
+            thumb = blank_thumbnail
+        thumbnail_cache.put(key, thumb)
+    return thumb
+
+def invalidate_thumbnails(img_id):
+    """Drop img_id's cached and in-flight thumbnails in both orientations after its marks change"""
+    for flipped in (True, False):
+        thumbnail_cache.invalidate((img_id, flipped))
+        # A render submitted before the change would otherwise be cached by get_thumbnail
+        future = pending_thumbnails.pop((img_id, flipped), None)
+        if future is not None:
+            future.cancel()
+
+def prefetch_thumbnails(start_idx, end_idx, margin=8):
+    """Start rendering the thumbnails just outside the visible strip so scrolling finds them ready"""
+    ahead = range(end_idx, min(len(image_ids), end_idx + margin))
+    behind = range(max(0, start_idx - margin), start_idx)
+    for i in (*ahead, *behind):
+        if (image_ids[i], y_axis_flipped[0]) not in thumbnail_cache:
+            render_thumbnail_async(image_ids[i])
+
+def drain_thumbnail_renders():
+    """Swap finished background renders into the thumbnail axes still showing a placeholder"""
+    swapped = False
+    for i in list(placeholder_thumbs):
+        thumb = get_thumbnail(image_ids[i], wait=False)
+        if thumb is None:
+            continue
+        placeholder_thumbs.discard(i)
+        if thumb_axes[i].images:
+            thumb_axes[i].images[0].set_data(thumb)
+            swapped = True
+    if not placeholder_thumbs:
+        thumbnail_timer[0].stop()
+    if swapped:
+        fig.canvas.draw_idle()
 
 # Global variables for plotting
 df = None
 output_dir = None
 image_ids = []
+image_row_indices = {}  # image_id -> positional row slice (or indices) in df
 annotation_states = {}
-thumbnails = []
+thumbnail_cache = ImageLRU(max_bytes=64 << 20)  # (image_id, y_axis_flipped) -> thumbnail, rendered when first shown
+thumbnail_render_pool = ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1), thread_name_prefix='thumbnail')
+pending_thumbnails = {}  # (image_id, y_axis_flipped) -> Future from thumbnail_render_pool
+placeholder_thumbs = set()  # Indices of thumbnail axes showing a blank while their render runs (progressive loading)
+thumbnail_timer = [None]  # Canvas timer that runs drain_thumbnail_renders on the GUI thread
+blank_thumbnail = np.full((250, 250, 3), 255, dtype=np.uint8)  # White stand-in, same shape as a real thumbnail
 thumb_axes = []
+highlighted_thumb_idx = [None]  # Thumbnail currently framed in blue, None until the first highlight
 current_image_idx = [0]
 label_columns = []  # Will be populated with label columns from CSV
 image_url_columns = []
-loaded_images = {}
+loaded_images = ImageLRU()
 labels_enabled = [True]
 show_background_image = [False]
 y_axis_flipped = [True]
 nav_text = None
+plot_background = [None]  # Figure pixels from the last full draw, restored before blitting hover labels
+close_save_thread = None
+screen_size = None  # (width, height) read from the welcome window, reused by the plot window
+startup_cwd = os.getcwd()  # Initial folder for the CSV file dialog
 help_text_box = None
 btn_help = None
 btn_website = None
 
+# Static screen text, built once at import rather than on every page show
+WELCOME_DESCRIPTION = (
+    "Welcome! This tool helps you visualize and annotate bounding box data directly from your CSV file.\n\n\n"
+    "Please note!\n"
+    "Your CSV must include columns for `image_id`, `x_min`, `x_max`, `y_min`, `y_max`\n"
+    "Optionally you can add `label_*` or image URL columns.\n\n\n"
+    "Click the button below to get started.\n"
+    "⬇"
+)
+
+# Professional tabular help content with clickable links
+HELP_CONTENT = """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                          KEYBOARD SHORTCUTS REFERENCE                        ║
+╠══════════════════════════════════════════════════════════════════════════════╣
+║  ┌────────────────────────────────────────────────────────────────────────┐  ║
+║  │                           NAVIGATION                                   │  ║
+║  ├────────────────────────────────────────────────────────────────────────┤  ║
+║  │  ← / → or A/D           │  Navigate to Previous/Next image             │  ║
+║  │  Home / End             │  Jump to First/Last image                    │  ║
+║  │  PageUp / PageDown      │  Jump ±10 images                             │  ║
+║  │  1-9                    │  Jump to specific image (1st-9th)            │  ║
+║  └────────────────────────────────────────────────────────────────────────┘  ║
+║  ┌────────────────────────────────────────────────────────────────────────┐  ║
+║  │                            ACTIONS                                     │  ║
+║  ├────────────────────────────────────────────────────────────────────────┤  ║
+║  │  R                      │  Reset annotation counter                    │  ║
+║  │  S                      │  Save annotations and data                   │  ║
+║  │  L                      │  Toggle hover labels on/off                  │  ║
+║  │  F                      │  Flip Y-axis orientation                     │  ║
+║  │  B                      │  Toggle background image (if enabled)        │  ║
+║  │  O or Enter/Return      │  Open current image in browser               │  ║
+║  └────────────────────────────────────────────────────────────────────────┘  ║
+║  ┌────────────────────────────────────────────────────────────────────────┐  ║
+║  │                        NATIVE OS SHORTCUTS                             │  ║
+║  ├────────────────────────────────────────────────────────────────────────┤  ║
+║  │  Ctrl+Z / Cmd+Z        │  Undo last annotation                         │  ║
+║  │  Ctrl+Y / Cmd+Y        │  Redo undone annotation                       │  ║
+║  │  Ctrl+S / Cmd+S        │  Save (same as S key)                         │  ║
+║  └────────────────────────────────────────────────────────────────────────┘  ║
+║  ┌────────────────────────────────────────────────────────────────────────┐  ║
+║  │                              NOTES                                     │  ║
+║  ├────────────────────────────────────────────────────────────────────────┤  ║
+║  │  • Press H, ?, or F1 to show this help again                           │  ║
+║  │  • Press ESC or click the ✕ button to close this help page             │  ║
+║  └────────────────────────────────────────────────────────────────────────┘  ║
+╚══════════════════════════════════════════════════════════════════════════════╝"""
+
+def get_total_ram_bytes():
+    """Return total physical memory in bytes using only the standard library, or None if unknown"""
+    # Linux and macOS
+    if hasattr(os, 'sysconf') and 'SC_PAGE_SIZE' in os.sysconf_names and 'SC_PHYS_PAGES' in os.sysconf_names:
+        try:
+            return os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES')
+        except (ValueError, OSError):
+            pass
+    
+    # Windows
+    if sys.platform == 'win32':
+        try:
+            import ctypes
+            
+            class MEMORYSTATUSEX(ctypes.Structure):
+                _fields_ = [
+                    ('dwLength', ctypes.c_ulong),
+                    ('dwMemoryLoad', ctypes.c_ulong),
+                    ('ullTotalPhys', ctypes.c_ulonglong),
+                    ('ullAvailPhys', ctypes.c_ulonglong),
+                    ('ullTotalPageFile', ctypes.c_ulonglong),
+                    ('ullAvailPageFile', ctypes.c_ulonglong),
+                    ('ullTotalVirtual', ctypes.c_ulonglong),
+                    ('ullAvailVirtual', ctypes.c_ulonglong),
+                    ('ullAvailExtendedVirtual', ctypes.c_ulonglong),
+                ]
+            
+            status = MEMORYSTATUSEX()
+            status.dwLength = ctypes.sizeof(MEMORYSTATUSEX)
+            if ctypes.windll.kernel32.GlobalMemoryStatusEx(ctypes.byref(status)):
+                return status.ullTotalPhys
+        except Exception:
+            pass
+    
+    return None
+
+# Device detection (hardware doesn't change during a run, so probe it once)
+@functools.lru_cache(maxsize=1)
+def get_device_profile():
+    """Get device hardware profile for intelligent suggestions"""
+    # Standard library first; psutil is a heavy import and only needed if these come up empty
+    cpu_cores = os.cpu_count()
+    ram_bytes = get_total_ram_bytes()
+    if cpu_cores is None or ram_bytes is None:
+        try:
+            import psutil
+            cpu_cores = cpu_cores or psutil.cpu_count()
+            ram_bytes = ram_bytes or psutil.virtual_memory().total
+        except ImportError:
+            pass
+    
+    # Simple storage type detection
+    storage_type = 'hdd'  # Default assumption
+    try:
+        # This is a simplified check - in practice you might want more sophisticated detection
+        if sys.platform.startswith('linux') and os.path.exists('/sys/block/sda/queue/rotational'):
+            with open('/sys/block/sda/queue/rotational', 'r') as f:
+                if f.read().strip() == '0':
+                    storage_type = 'ssd'
+    except:
+        pass
+    
+    return {
+        'cpu_cores': cpu_cores or 4,  # Fallback if nothing could detect it
+        'ram_gb': ram_bytes / (1024**3) if ram_bytes else 8,
+        'storage_type': storage_type
+    }
+
+def calculate_performance_score(profile):
+    """Calculate performance score (0-100) based on hardware"""
+    score = 0
+    score += min(profile['ram_gb'] / 16, 1) * 40  # RAM: 40 points (16GB = 100%)
+    score += min(profile['cpu_cores'] / 8, 1) * 30  # CPU: 30 points (8 cores = 100%)
+    score += 20 if profile['storage_type'] == 'ssd' else 10  # Storage: 20 points
+    score += 10  # Base score
+    return min(100, max(0, int(score)))
+
+@functools.lru_cache(maxsize=None)
+def get_performance_suggestion(score):
+    """Get performance mode suggestion based on score"""
+    if score >= 80:
+        return 'high', 'High Performance (All features)'
+    elif score >= 50:
+        return 'balanced', 'Balanced (Recommended)'
+    else:
+        return 'low', 'Low-End Optimized'
+
+@functools.lru_cache(maxsize=1)
+def get_device_summary_text():
+    """Return the (device, score, suggestion) lines shown in the settings Device Information section"""
+    device_profile = get_device_profile()
+    performance_score = calculate_performance_score(device_profile)
+    suggested_mode, suggested_text = get_performance_suggestion(performance_score)
+    return (
+        f"RAM: {device_profile['ram_gb']:.1f}GB | CPU: {device_profile['cpu_cores']} cores | Storage: {device_profile['storage_type'].upper()}",
+        f"Performance Score: {performance_score}/100",
+        f"Suggested Mode: {suggested_text}",
+    )
+
+# Performance profile radio buttons on the settings page: (value, label)
+PROFILE_CHOICES = [
+    ('high', "High Performance (All features)"),
+    ('balanced', "Balanced (Recommended)"),
+    ('low', "Low-End Optimized"),
+    ('custom', "Custom"),
+]
+
+# Checkbox sections on the settings page: (section title, [(settings key, label, description), ...])
+FEATURE_TOGGLE_SECTIONS = [
+    ("🎨 Feature Toggles", [
+        ('show_background_images', "Background Images", "Disabled by default - may impact performance"),
+        ('high_quality_thumbnails', "High-Quality Thumbnails", "Recommended for your device"),
+        ('real_time_hover', "Real-time Hover Labels", ""),
+        ('smooth_animations', "Smooth Animations", "May impact performance"),
+        ('anti_aliasing', "Anti-aliasing", "High-end feature"),
+    ]),
+    ("🔧 Additional Settings", [
+        ('disable_background_image_button', "Disable Background Image Button", "Enabled by default - removes button from UI"),
+        ('save_plots_on_close', "Save Plots on Program Close", "Automatically save plots when closing"),
+    ]),
+    ("💾 Memory Management", [
+        ('progressive_loading', "Progressive Thumbnail Loading", "Recommended for low-end"),
+        ('image_caching', "Image Caching", "Recommended for your device"),
+        ('aggressive_cleanup', "Aggressive Memory Cleanup", "Low-end optimization"),
+    ]),
+]
+
+# Feature toggles applied by each performance profile ('custom' leaves them untouched).
+# Background images and their button are disabled by default for all profiles.
+PERFORMANCE_PROFILES = {
+    'high': {
+        'show_background_images': False,
+        'high_quality_thumbnails': True,
+        'real_time_hover': True,
+        'smooth_animations': True,
+        'anti_aliasing': True,
+        'progressive_loading': False,
+        'image_caching': True,
+        'aggressive_cleanup': False,
+        'disable_background_image_button': True,
+    },
+    'balanced': {
+        'show_background_images': False,
+        'high_quality_thumbnails': True,
+        'real_time_hover': True,
+        'smooth_animations': False,
+        'anti_aliasing': True,
+        'progressive_loading': False,
+        'image_caching': True,
+        'aggressive_cleanup': False,
+        'disable_background_image_button': True,
+    },
+    'low': {
+        'show_background_images': False,
+        'high_quality_thumbnails': False,
+        'real_time_hover': False,
+        'smooth_animations': False,
+        'anti_aliasing': False,
+        'progressive_loading': True,
+        'image_caching': False,
+        'aggressive_cleanup': True,
+        'disable_background_image_button': True,
+    },
+}
+
 # --- NEW: Welcome Screen Function with Settings ---
 def show_welcome_screen_and_get_filepath():
     """
     Displays a welcome screen with settings option and handles file selection.
     Returns the selected file path or an empty string if canceled.
     """
+    # Warm the cached device probe (RAM/CPU/sysfs reads) off the UI thread while the window builds
+    threading.Thread(target=get_device_summary_text, name="device-probe", daemon=True).start()
+    
     # Create the main window
     root = tk.Tk()
     root.title("Bounding Box Plotter")
     root.configure(bg="#f0f0f0")  # Set a light gray background
+    
+    # White panels with dark text are the default look; widgets only pass colors that differ
+    for widget_class in ("Frame", "Canvas", "Label", "Labelframe", "Checkbutton", "Radiobutton"):
+        root.option_add(f"*{widget_class}.background", "#ffffff")
+    for widget_class in ("Label", "Labelframe", "Checkbutton", "Radiobutton"):
+        root.option_add(f"*{widget_class}.foreground", "#333333")
 
     # Store file path in a list to be mutable by inner functions
     file_path_holder = [""]
+    welcome_frame_holder = [None]  # Welcome page frame, created on first show
+    settings_frame_holder = [None]  # Settings page frame, created on first open
     
     def select_file_and_close():
         # Open file dialog
         path = filedialog.askopenfilename(
+            parent=root,
             title="Select CSV file",
+            initialdir=startup_cwd,
             filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]
         )
         if path:
@@ -299,138 +824,63 @@ def show_welcome_screen_and_get_filepath():
         'enable_debug_logging': tk.BooleanVar(value=False)  # Default disabled
     }
     
-    # Device detection
-    def get_device_profile():
-        """Get device hardware profile for intelligent suggestions"""
-        try:
-            import psutil
-            cpu_cores = psutil.cpu_count()
-            ram_gb = psutil.virtual_memory().total / (1024**3)
-            
-            # Simple storage type detection
-            storage_type = 'hdd'  # Default assumption
-            try:
-                # This is a simplified check - in practice you might want more sophisticated detection
-                if os.path.exists('/sys/block/sda/queue/rotational'):
-                    with open('/sys/block/sda/queue/rotational', 'r') as f:
-                        if f.read().strip() == '0':
-                            storage_type = 'ssd'
-            except:
-                pass
-            
-            return {
-                'cpu_cores': cpu_cores,
-                'ram_gb': ram_gb,
-                'storage_type': storage_type
-            }
-        except ImportError:
-            # Fallback if psutil not available
-            return {
-                'cpu_cores': 4,
-                'ram_gb': 8,
-                'storage_type': 'hdd'
-            }
-    
-    def calculate_performance_score(profile):
-        """Calculate performance score (0-100) based on hardware"""
-        score = 0
-        score += min(profile['ram_gb'] / 16, 1) * 40  # RAM: 40 points (16GB = 100%)
-        score += min(profile['cpu_cores'] / 8, 1) * 30  # CPU: 30 points (8 cores = 100%)
-        score += 20 if profile['storage_type'] == 'ssd' else 10  # Storage: 20 points
-        score += 10  # Base score
-        return min(100, max(0, int(score)))
-    
-    def get_performance_suggestion(score):
-        """Get performance mode suggestion based on score"""
-        if score >= 80:
-            return 'high', 'High Performance (All features)'
-        elif score >= 50:
-            return 'balanced', 'Balanced (Recommended)'
-        else:
-            return 'low', 'Low-End Optimized'
-    
     def apply_performance_profile(profile_name):
         """Apply predefined performance profile settings"""
-        if profile_name == 'high':
-            settings['show_background_images'].set(False)  # Disabled by default for all profiles
-            settings['high_quality_thumbnails'].set(True)
-            settings['real_time_hover'].set(True)
-            settings['smooth_animations'].set(True)
-            settings['anti_aliasing'].set(True)
-            settings['progressive_loading'].set(False)
-            settings['image_caching'].set(True)
-            settings['aggressive_cleanup'].set(False)
-            settings['disable_background_image_button'].set(True)  # Button disabled by default for all profiles
-        elif profile_name == 'balanced':
-            settings['show_background_images'].set(False)  # Disabled by default for all profiles
-            settings['high_quality_thumbnails'].set(True)
-            settings['real_time_hover'].set(True)
-            settings['smooth_animations'].set(False)
-            settings['anti_aliasing'].set(True)
-            settings['progressive_loading'].set(False)
-            settings['image_caching'].set(True)
-            settings['aggressive_cleanup'].set(False)
-            settings['disable_background_image_button'].set(True)  # Button disabled by default for all profiles
-        elif profile_name == 'low':
-            settings['show_background_images'].set(False)  # Disabled by default for all profiles
-            settings['high_quality_thumbnails'].set(False)
-            settings['real_time_hover'].set(False)
-            settings['smooth_animations'].set(False)
-            settings['anti_aliasing'].set(False)
-            settings['progressive_loading'].set(True)
-            settings['image_caching'].set(False)
-            settings['aggressive_cleanup'].set(True)
-            settings['disable_background_image_button'].set(True)  # Button disabled by default for all profiles
+        # Only touch variables whose value changes; each set() is a Tcl call plus trace callbacks
+        for key, value in PERFORMANCE_PROFILES.get(profile_name, {}).items():
+            if settings[key].get() != value:
+                settings[key].set(value)
     
     def show_settings_page():
         """Show the settings page in the same window"""
-        # Clear main frame
+        # Hide the welcome page; both pages are built once and re-packed
         for widget in main_frame.winfo_children():
-            widget.destroy()
+            widget.pack_forget()
+        if settings_frame_holder[0] is not None:
+            settings_frame_holder[0].reset()
+            settings_frame_holder[0].pack(expand=True, fill="both", padx=10, pady=10)
+            return
         
         # Create settings page
-        settings_frame = tk.Frame(main_frame, bg="#ffffff")
-        settings_frame.pack(expand=True, fill="both", padx=10, pady=10)
+        # Packed only once fully assembled, so the window lays out the finished page in one pass
+        settings_frame = tk.Frame(main_frame)
+        settings_frame_holder[0] = settings_frame
         
         # Settings title
-        settings_title = tk.Label(settings_frame, text="⚙️ Performance Settings", font=title_font, bg="#ffffff", fg="#333333", pady=5)
+        settings_title = tk.Label(settings_frame, text="⚙️ Performance Settings", font=title_font, pady=5)
         settings_title.pack(pady=(0, 10))
         
         # Create scrollable frame for settings
-        canvas = tk.Canvas(settings_frame, bg="#ffffff", highlightthickness=0)
+        canvas = tk.Canvas(settings_frame, highlightthickness=0)
         scrollbar = tk.Scrollbar(settings_frame, orient="vertical", command=canvas.yview)
-        scrollable_frame = tk.Frame(canvas, bg="#ffffff")
+        scrollable_frame = tk.Frame(canvas)
         
+        # The frame is the canvas's only item, so its new size is the scroll region (no bbox("all") scan)
         scrollable_frame.bind(
             "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
+            lambda e: canvas.configure(scrollregion=(0, 0, e.width, e.height))
         )
         
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
         
         # Device info section
-        device_profile = get_device_profile()
-        performance_score = calculate_performance_score(device_profile)
-        suggested_mode, suggested_text = get_performance_suggestion(performance_score)
+        device_info, score_info, suggestion_info = get_device_summary_text()
         
-        device_frame = tk.LabelFrame(scrollable_frame, text="📱 Device Information", font=body_font, bg="#ffffff", fg="#333333", padx=10, pady=5)
+        device_frame = tk.LabelFrame(scrollable_frame, text="📱 Device Information", font=body_font, padx=10, pady=5)
         device_frame.pack(fill="x", padx=5, pady=5)
         
-        device_info = f"RAM: {device_profile['ram_gb']:.1f}GB | CPU: {device_profile['cpu_cores']} cores | Storage: {device_profile['storage_type'].upper()}"
-        device_label = tk.Label(device_frame, text=device_info, font=body_font, bg="#ffffff", fg="#555555")
+        device_label = tk.Label(device_frame, text=device_info, font=body_font, fg="#555555")
         device_label.pack(pady=2)
         
-        score_info = f"Performance Score: {performance_score}/100"
-        score_label = tk.Label(device_frame, text=score_info, font=body_font, bg="#ffffff", fg="#555555")
+        score_label = tk.Label(device_frame, text=score_info, font=body_font, fg="#555555")
         score_label.pack(pady=2)
         
-        suggestion_info = f"Suggested Mode: {suggested_text}"
-        suggestion_label = tk.Label(device_frame, text=suggestion_info, font=body_font, bg="#ffffff", fg="#28a745")
+        suggestion_label = tk.Label(device_frame, text=suggestion_info, font=body_font, fg="#28a745")
         suggestion_label.pack(pady=2)
         
         # Performance profile section
-        profile_frame = tk.LabelFrame(scrollable_frame, text="🚀 Performance Profile", font=body_font, bg="#ffffff", fg="#333333", padx=10, pady=5)
+        profile_frame = tk.LabelFrame(scrollable_frame, text="🚀 Performance Profile", font=body_font, padx=10, pady=5)
         profile_frame.pack(fill="x", padx=5, pady=5)
         
         profile_var = tk.StringVar(value=settings['performance_mode'].get())
@@ -441,18 +891,9 @@ def show_welcome_screen_and_get_filepath():
             apply_performance_profile(selected)
             update_settings_display()
         
-        tk.Radiobutton(profile_frame, text="High Performance (All features)", variable=profile_var, value="high", 
-                      command=on_profile_change, font=body_font, bg="#ffffff", fg="#333333").pack(anchor="w", pady=2)
-        tk.Radiobutton(profile_frame, text="Balanced (Recommended)", variable=profile_var, value="balanced", 
-                      command=on_profile_change, font=body_font, bg="#ffffff", fg="#333333").pack(anchor="w", pady=2)
-        tk.Radiobutton(profile_frame, text="Low-End Optimized", variable=profile_var, value="low", 
-                      command=on_profile_change, font=body_font, bg="#ffffff", fg="#333333").pack(anchor="w", pady=2)
-        tk.Radiobutton(profile_frame, text="Custom", variable=profile_var, value="custom", 
-                      command=on_profile_change, font=body_font, bg="#ffffff", fg="#333333").pack(anchor="w", pady=2)
-        
-        # Feature toggles section
-        features_frame = tk.LabelFrame(scrollable_frame, text="🎨 Feature Toggles", font=body_font, bg="#ffffff", fg="#333333", padx=10, pady=5)
-        features_frame.pack(fill="x", padx=5, pady=5)
+        for value, text in PROFILE_CHOICES:
+            tk.Radiobutton(profile_frame, text=text, variable=profile_var, value=value, 
+                          command=on_profile_change, font=body_font).pack(anchor="w", pady=2)
         
         def update_settings_display():
             """Update the display of settings based on current values"""
@@ -462,68 +903,35 @@ def show_welcome_screen_and_get_filepath():
         feature_checkboxes = {}
         
         def create_feature_checkbox(parent, text, setting_var, description=""):
-            frame = tk.Frame(parent, bg="#ffffff")
-            frame.pack(fill="x", pady=2)
+            # Grid rows directly in the section frame instead of wrapping each row in its own Frame
+            row = parent.grid_size()[1]
             
-            cb = tk.Checkbutton(frame, text=text, variable=setting_var, font=body_font, bg="#ffffff", fg="#333333")
-            cb.pack(side="left")
+            cb = tk.Checkbutton(parent, text=text, variable=setting_var, font=body_font)
+            cb.grid(row=row, column=0, sticky="w", pady=2)
             
             if description:
-                desc_label = tk.Label(frame, text=description, font=tkFont.Font(family="Helvetica", size=9), 
-                                    bg="#ffffff", fg="#888888")
-                desc_label.pack(side="left", padx=(10, 0))
+                desc_label = tk.Label(parent, text=description, font=small_font, 
+                                    fg="#888888")
+                desc_label.grid(row=row, column=1, sticky="w", padx=(10, 0), pady=2)
             
             return cb
         
-        feature_checkboxes['bg_images'] = create_feature_checkbox(features_frame, "Background Images", 
-                                                               settings['show_background_images'], 
-                                                               "Disabled by default - may impact performance")
-        feature_checkboxes['high_quality'] = create_feature_checkbox(features_frame, "High-Quality Thumbnails", 
-                                                                   settings['high_quality_thumbnails'], 
-                                                                   "Recommended for your device")
-        feature_checkboxes['real_time'] = create_feature_checkbox(features_frame, "Real-time Hover Labels", 
-                                                                settings['real_time_hover'])
-        feature_checkboxes['smooth'] = create_feature_checkbox(features_frame, "Smooth Animations", 
-                                                             settings['smooth_animations'], 
-                                                             "May impact performance")
-        feature_checkboxes['anti_aliasing'] = create_feature_checkbox(features_frame, "Anti-aliasing", 
-                                                                   settings['anti_aliasing'], 
-                                                                   "High-end feature")
-        
-        # Additional settings section
-        additional_frame = tk.LabelFrame(scrollable_frame, text="🔧 Additional Settings", font=body_font, bg="#ffffff", fg="#333333", padx=10, pady=5)
-        additional_frame.pack(fill="x", padx=5, pady=5)
-        
-        feature_checkboxes['disable_bg_button'] = create_feature_checkbox(additional_frame, "Disable Background Image Button", 
-                                                                        settings['disable_background_image_button'], 
-                                                                        "Enabled by default - removes button from UI")
-        feature_checkboxes['save_plots'] = create_feature_checkbox(additional_frame, "Save Plots on Program Close", 
-                                                                 settings['save_plots_on_close'], 
-                                                                 "Automatically save plots when closing")
-        
-        # Memory management section
-        memory_frame = tk.LabelFrame(scrollable_frame, text="💾 Memory Management", font=body_font, bg="#ffffff", fg="#333333", padx=10, pady=5)
-        memory_frame.pack(fill="x", padx=5, pady=5)
-        
-        feature_checkboxes['progressive'] = create_feature_checkbox(memory_frame, "Progressive Thumbnail Loading", 
-                                                                  settings['progressive_loading'], 
-                                                                  "Recommended for low-end")
-        feature_checkboxes['caching'] = create_feature_checkbox(memory_frame, "Image Caching", 
-                                                              settings['image_caching'], 
-                                                              "Recommended for your device")
-        feature_checkboxes['cleanup'] = create_feature_checkbox(memory_frame, "Aggressive Memory Cleanup", 
-                                                              settings['aggressive_cleanup'], 
-                                                              "Low-end optimization")
+        # Feature toggles, additional settings and memory management sections
+        for section_title, toggles in FEATURE_TOGGLE_SECTIONS:
+            section_frame = tk.LabelFrame(scrollable_frame, text=section_title, font=body_font, padx=10, pady=5)
+            section_frame.pack(fill="x", padx=5, pady=5)
+            for key, text, description in toggles:
+                feature_checkboxes[key] = create_feature_checkbox(section_frame, text, settings[key], description)
         
         # Thumbnail settings section
-        thumbnail_frame = tk.LabelFrame(scrollable_frame, text="🖼️ Thumbnail Settings", font=body_font, bg="#ffffff", fg="#333333", padx=10, pady=5)
+        thumbnail_frame = tk.LabelFrame(scrollable_frame, text="🖼️ Thumbnail Settings", font=body_font, padx=10, pady=5)
         thumbnail_frame.pack(fill="x", padx=5, pady=5)
         
         # Thumbnail width setting
-        width_frame = tk.Frame(thumbnail_frame, bg="#ffffff")
+        width_frame = tk.Frame(thumbnail_frame)
         width_frame.pack(fill="x", pady=2)
         
-        width_label = tk.Label(width_frame, text="Thumbnail Width (% of figure):", font=body_font, bg="#ffffff", fg="#333333")
+        width_label = tk.Label(width_frame, text="Thumbnail Width (% of figure):", font=body_font)
         width_label.pack(side="left")
         
         width_var = tk.StringVar(value="5.0")
@@ -531,25 +939,33 @@ def show_welcome_screen_and_get_filepath():
         width_entry.pack(side="left", padx=(10, 0))
         
         # Thumbnail padding setting
-        padding_frame = tk.Frame(thumbnail_frame, bg="#ffffff")
+        padding_frame = tk.Frame(thumbnail_frame)
         padding_frame.pack(fill="x", pady=2)
         
-        padding_label = tk.Label(padding_frame, text="Thumbnail Padding (% of figure):", font=body_font, bg="#ffffff", fg="#333333")
+        padding_label = tk.Label(padding_frame, text="Thumbnail Padding (% of figure):", font=body_font)
         padding_label.pack(side="left")
         
         padding_var = tk.StringVar(value="0.8")
         padding_entry = tk.Entry(padding_frame, textvariable=padding_var, font=body_font, width=8)
         padding_entry.pack(side="left", padx=(10, 0))
         
+        def reset_settings_page():
+            """Put a reused settings page back into the state a fresh build starts in"""
+            width_var.set("5.0")
+            padding_var.set("0.8")
+            apply_performance_profile(settings['performance_mode'].get())
+        
+        settings_frame.reset = reset_settings_page
+        
         # Logging settings section
-        logging_frame = tk.LabelFrame(scrollable_frame, text="📝 Logging & Debugging", font=body_font, bg="#ffffff", fg="#333333", padx=10, pady=5)
+        logging_frame = tk.LabelFrame(scrollable_frame, text="📝 Logging & Debugging", font=body_font, padx=10, pady=5)
         logging_frame.pack(fill="x", padx=5, pady=5)
         
         # Log retention setting
-        retention_frame = tk.Frame(logging_frame, bg="#ffffff")
+        retention_frame = tk.Frame(logging_frame)
         retention_frame.pack(fill="x", pady=2)
         
-        retention_label = tk.Label(retention_frame, text="Log Retention:", font=body_font, bg="#ffffff", fg="#333333")
+        retention_label = tk.Label(retention_frame, text="Log Retention:", font=body_font)
         retention_label.pack(side="left")
         
         retention_var = settings['log_retention']
@@ -560,11 +976,11 @@ def show_welcome_screen_and_get_filepath():
         # Debug logging toggle
         debug_var = settings['enable_debug_logging']
         debug_checkbox = tk.Checkbutton(logging_frame, text="Enable Debug Logging", variable=debug_var, 
-                                       font=body_font, bg="#ffffff", fg="#333333")
+                                       font=body_font)
         debug_checkbox.pack(anchor="w", pady=2)
         
         # Log management buttons
-        log_buttons_frame = tk.Frame(logging_frame, bg="#ffffff")
+        log_buttons_frame = tk.Frame(logging_frame)
         log_buttons_frame.pack(fill="x", pady=(10, 0))
         
         download_logs_btn = tk.Button(log_buttons_frame, text="📥 Download Logs", 
@@ -585,7 +1001,7 @@ def show_welcome_screen_and_get_filepath():
         apply_performance_profile(settings['performance_mode'].get())
         
         # Buttons section
-        buttons_frame = tk.Frame(scrollable_frame, bg="#ffffff")
+        buttons_frame = tk.Frame(scrollable_frame)
         buttons_frame.pack(fill="x", padx=5, pady=10)
         
         def save_settings():
@@ -612,23 +1028,10 @@ def show_welcome_screen_and_get_filepath():
                 thumb_width = 0.06
                 thumb_padding = 0.01
             
-            global_settings = {
-                'performance_mode': settings['performance_mode'].get(),
-                'show_background_images': settings['show_background_images'].get(),
-                'high_quality_thumbnails': settings['high_quality_thumbnails'].get(),
-                'real_time_hover': settings['real_time_hover'].get(),
-                'smooth_animations': settings['smooth_animations'].get(),
-                'anti_aliasing': settings['anti_aliasing'].get(),
-                'progressive_loading': settings['progressive_loading'].get(),
-                'image_caching': settings['image_caching'].get(),
-                'aggressive_cleanup': settings['aggressive_cleanup'].get(),
-                'disable_background_image_button': settings['disable_background_image_button'].get(),
-                'save_plots_on_close': settings['save_plots_on_close'].get(),
-                'log_retention': retention_var.get(),
-                'enable_debug_logging': debug_var.get(),
-                'thumbnail_width': thumb_width,
-                'thumbnail_padding': thumb_padding
-            }
+            # Snapshot every settings variable in one pass (log retention and debug logging included)
+            global_settings = {key: var.get() for key, var in settings.items()}
+            global_settings['thumbnail_width'] = thumb_width
+            global_settings['thumbnail_padding'] = thumb_padding
             
             # Clean up old logs based on new retention setting
             cleanup_old_logs()
@@ -673,49 +1076,37 @@ def show_welcome_screen_and_get_filepath():
             
             canvas.yview_scroll(delta, "units")
         
-        # Bind mouse wheel to canvas
+        # bind_all is application-wide, so one binding per event covers every child widget
         canvas.bind_all("<MouseWheel>", _on_mousewheel)
+        # Also bind Linux-specific scroll events
+        canvas.bind_all("<Button-4>", lambda e: canvas.yview_scroll(-1, "units"))
+        canvas.bind_all("<Button-5>", lambda e: canvas.yview_scroll(1, "units"))
         
-        # Also bind mouse wheel to the scrollable frame for better coverage
-        scrollable_frame.bind_all("<MouseWheel>", _on_mousewheel)
-        
-        # Bind mouse wheel to all child widgets in the scrollable frame
-        def bind_mousewheel_to_widgets(widget):
-            """Recursively bind mouse wheel to all child widgets"""
-            widget.bind_all("<MouseWheel>", _on_mousewheel)
-            # Also bind Linux-specific scroll events
-            widget.bind_all("<Button-4>", lambda e: canvas.yview_scroll(-1, "units"))
-            widget.bind_all("<Button-5>", lambda e: canvas.yview_scroll(1, "units"))
-            for child in widget.winfo_children():
-                bind_mousewheel_to_widgets(child)
-        
-        # Apply mouse wheel binding to all widgets in the scrollable frame
-        bind_mousewheel_to_widgets(scrollable_frame)
+        settings_frame.pack(expand=True, fill="both", padx=10, pady=10)
     
     def show_welcome_page():
         """Show the main welcome page"""
-        # Clear main frame
+        # Hide the settings page; both pages are built once and re-packed
         for widget in main_frame.winfo_children():
-            widget.destroy()
+            widget.pack_forget()
+        if welcome_frame_holder[0] is not None:
+            welcome_frame_holder[0].pack(expand=True, fill="both")
+            return
+        
+        welcome_frame = tk.Frame(main_frame)
+        welcome_frame.pack(expand=True, fill="both")
+        welcome_frame_holder[0] = welcome_frame
         
         # Welcome Label with an icon
-        welcome_label = tk.Label(main_frame, text="Bounding Box Plotter", font=title_font, bg="#ffffff", fg="#333333", pady=10)
+        welcome_label = tk.Label(welcome_frame, text="Bounding Box Plotter", font=title_font, pady=10)
         welcome_label.pack(pady=(0, 15))
         
         # Description Text
-        description_text = (
-            "Welcome! This tool helps you visualize and annotate bounding box data directly from your CSV file.\n\n\n"
-            "Please note!\n"
-            "Your CSV must include columns for `image_id`, `x_min`, `x_max`, `y_min`, `y_max`\n"
-            "Optionally you can add `label_*` or image URL columns.\n\n\n"
-            "Click the button below to get started.\n"
-            "⬇"
-        )
-        description_label = tk.Label(main_frame, text=description_text, font=body_font, justify=tk.CENTER, bg="#ffffff", fg="#555555", pady=10)
+        description_label = tk.Label(welcome_frame, text=WELCOME_DESCRIPTION, font=body_font, justify=tk.CENTER, fg="#555555", pady=10)
         description_label.pack()
         
         # Buttons frame
-        buttons_frame = tk.Frame(main_frame, bg="#ffffff")
+        buttons_frame = tk.Frame(welcome_frame)
         buttons_frame.pack(pady=(10, 0))
         
         # Select File Button with enhanced styling (centered)
@@ -737,7 +1128,7 @@ def show_welcome_screen_and_get_filepath():
         select_button.pack(pady=(0, 20))  # Center the main button with bottom margin
         
         # Bottom row for settings and exit buttons
-        bottom_buttons_frame = tk.Frame(main_frame, bg="#ffffff")
+        bottom_buttons_frame = tk.Frame(welcome_frame)
         bottom_buttons_frame.pack(side="bottom", fill="x", padx=10, pady=(0, 10))
         
         # Settings Button (bottom left) - Enhanced styling
@@ -825,18 +1216,22 @@ def show_welcome_screen_and_get_filepath():
     window_height = 450
     screen_width = root.winfo_screenwidth()
     screen_height = root.winfo_screenheight()
+    global screen_size
+    screen_size = (screen_width, screen_height)
     center_x = int(screen_width/2 - window_width / 2)
     center_y = int(screen_height/2 - window_height / 2)
     root.geometry(f'{window_width}x{window_height}+{center_x}+{center_y}')
     root.resizable(True, True)  # Allow resizing for settings page
     
     # Set up fonts with enhanced styling
-    title_font = tkFont.Font(family="Helvetica", size=20, weight="bold")
-    body_font = tkFont.Font(family="Helvetica", size=11)
-    button_font = tkFont.Font(family="Helvetica", size=13, weight="bold")
+    # Plain font specs: Tk resolves these itself, no named Font objects to create and track
+    title_font = ("Helvetica", 20, "bold")
+    body_font = ("Helvetica", 11)
+    button_font = ("Helvetica", 13, "bold")
+    small_font = ("Helvetica", 9)  # Shared by all setting descriptions
     
     # Create a main frame with enhanced styling
-    main_frame = tk.Frame(root, bg="#ffffff", padx=20, pady=20, relief=tk.RAISED, borderwidth=3)
+    main_frame = tk.Frame(root, padx=20, pady=20, relief=tk.RAISED, borderwidth=3)
     main_frame.pack(expand=True, fill="both", padx=15, pady=15)
     
     # Show initial welcome page
@@ -890,18 +1285,26 @@ def setup_logging():
     session_id = datetime.now().strftime('%Y%m%d_%H%M%S')
     log_file = os.path.join(log_dir, f'plotter_session_{session_id}.log')
     
+    # Buffer file records and write them in batches; warnings and errors flush immediately
+    file_handler = logging.handlers.MemoryHandler(
+        capacity=50,
+        flushLevel=logging.WARNING,
+        target=logging.FileHandler(log_file, encoding='utf-8')
+    )
+    
     # Configure logging - always use INFO level for file logging, but add level info to messages
+    log_format = '%(asctime)s | %(levelname)s | %(funcName)s:%(lineno)d | %(message)s'
+    file_handler.target.setFormatter(logging.Formatter(log_format))
     logging.basicConfig(
         level=logging.INFO,
-        format='%(asctime)s | %(levelname)s | %(funcName)s:%(lineno)d | %(message)s',
+        format=log_format,
         handlers=[
-            logging.FileHandler(log_file, encoding='utf-8'),
+            file_handler,
             logging.StreamHandler()  # Also log to console
         ]
     )
     
     # Log system information
-    logger = logging.getLogger(__name__)
     logger.info("="*60)
     logger.info("NEW PLOTTER SESSION STARTED")
     logger.info(f"Session ID: {session_id}")
@@ -952,9 +1355,16 @@ def cleanup_old_logs():
     except Exception as e:
         print(f"Warning: Could not cleanup old logs: {e}")
 
+def flush_log_buffers():
+    """Write records still held by the buffered file handler out to the session log"""
+    for handler in logging.getLogger().handlers:
+        handler.flush()
+
 def get_log_summary():
     """Get summary of available logs"""
     try:
+        # The session log is written in batches, so flush it before its size or contents are read
+        flush_log_buffers()
         log_dir = os.path.join(tempfile.gettempdir(), 'plotter_logs')
         if not os.path.exists(log_dir):
             return []
@@ -1080,14 +1490,64 @@ def delete_logs():
 
 # Functions and classes moved to top level
 
+# Values that mark a CSV column as holding image links
+URL_PATTERN = re.compile(r'^(?:https?://|www\.)')
+
+@functools.lru_cache(maxsize=1)
+def get_http_session():
+    """Return the shared requests.Session so image fetches reuse keep-alive connections"""
+    # Imported on first use so the welcome screen doesn't pay for requests
+    import requests
+    session = requests.Session()
+    # Enough pooled connections per host for the prefetch workers plus the GUI thread
+    adapter = requests.adapters.HTTPAdapter(pool_connections=16, pool_maxsize=8)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
 # Function to load image from URL
-def load_image_from_url(url):
-    """Load image from URL and return as numpy array"""
+@functools.lru_cache(maxsize=1)
+def get_pyvips():
+    """Return the pyvips module when it and the libvips library load, otherwise None"""
+    try:
+        import pyvips
+    except (ImportError, OSError):
+        # The pyvips wheel raises OSError when the libvips shared library itself is missing
+        return None
+    return pyvips
+
+def load_image_from_url(url, max_size=None):
+    """Load image from URL and return as numpy array, shrunk while decoding to roughly max_size"""
     try:
-        response = requests.get(url, timeout=10)
+        # Imported on first use so the welcome screen doesn't pay for Pillow
+        from PIL import Image
+        response = get_http_session().get(url, timeout=10)
         response.raise_for_status()
+        
+        # The background only needs screen resolution, never the full-size original
+        if max_size is None:
+            max_size = screen_size or (1920, 1080)
+        
+        # Optional: libvips shrinks JPEGs in the DCT domain while decoding
+        pyvips = get_pyvips()
+        if pyvips is not None:
+            try:
+                vips_img = pyvips.Image.thumbnail_buffer(response.content, max_size[0],
+                                                         height=max_size[1], size='down')
+                if vips_img.format == 'uchar':
+                    return np.ndarray(buffer=vips_img.write_to_memory(), dtype=np.uint8,
+                                      shape=[vips_img.height, vips_img.width, vips_img.bands])
+            except Exception as e:
+                print(f"⚠ pyvips could not decode {url} ({e}), falling back to Pillow")
+        
         img = Image.open(io.BytesIO(response.content))
-        return np.array(img)
+        # JPEG decoders can scale by 1/2 to 1/8 on load; other formats ignore the draft request
+        img.draft('RGB', max_size)
+        if img.mode not in ('RGB', 'RGBA', 'L'):
+            img = img.convert('RGBA' if 'transparency' in img.info else 'RGB')
+        # Finish the shrink for PNGs and other formats draft can't scale (no-op when already small enough)
+        img.thumbnail(max_size)
+        return np.asarray(img)
     except Exception as e:
         print(f"Error loading image from {url}: {e}")
         return None
@@ -1101,8 +1561,55 @@ def open_image_in_browser(url):
         print(f"Error opening URL in browser: {e}")
         messagebox.showerror("Error", f"Could not open image URL: {e}")
 
-# Store loaded images
-loaded_images = {}
+# Store loaded images (bounded so long sessions with background images don't exhaust RAM)
+loaded_images = ImageLRU()
+
+# Background images of neighbouring plots are fetched here so network latency overlaps with drawing
+image_fetch_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix='image-fetch')
+pending_image_fetches = {}  # url -> Future from image_fetch_pool, only while the download runs
+# Reentrant: add_done_callback runs the callback inline when the fetch has already finished
+pending_image_fetches_lock = threading.RLock()
+
+def store_fetched_image(url, future):
+    """Move a finished fetch into loaded_images and retire its single-flight entry"""
+    with pending_image_fetches_lock:
+        if pending_image_fetches.get(url) is future:
+            del pending_image_fetches[url]
+            loaded_images.put(url, future.result())
+
+def fetch_background_image(url):
+    """Return the Future downloading url, starting it only if no fetch for url is in flight"""
+    with pending_image_fetches_lock:
+        future = pending_image_fetches.get(url)
+        if future is not None and future.done():
+            # Retire finished fetches here too: once their image is evicted from loaded_images,
+            # a stale entry would otherwise hand the old Future back instead of fetching again
+            store_fetched_image(url, future)
+        elif future is None:
+            future = pending_image_fetches[url] = image_fetch_pool.submit(load_image_from_url, url)
+            # Prefetched neighbours the user never opens still land in (and are bounded by) loaded_images
+            future.add_done_callback(functools.partial(store_fetched_image, url))
+    return future
+
+def get_background_image(url):
+    """Return the image array for url, joining an in-flight prefetch when there is one"""
+    if url not in loaded_images:
+        future = fetch_background_image(url)
+        img_array = future.result()
+        store_fetched_image(url, future)
+        if img_array is None:
+            print(f"Could not load image from {url}")
+        return img_array
+    return loaded_images.get(url)
+
+def prefetch_background_images(idx, radius=2):
+    """Start fetching the background images of the plots within radius of idx"""
+    for neighbour in range(idx - radius, idx + radius + 1):
+        if neighbour == idx or not 0 <= neighbour < len(image_ids):
+            continue
+        url = annotation_states[image_ids[neighbour]].image_url
+        if url and url not in loaded_images:
+            fetch_background_image(url)
 
 # Global state variables - these will be set by apply_global_settings()
 labels_enabled = [True]  # Default to True, will be updated by settings
@@ -1129,8 +1636,9 @@ def apply_global_settings():
     print(f"✓ Applied performance settings: {global_settings.get('performance_mode', 'balanced')}")
     print(f"✓ Current labels_enabled state: {labels_enabled[0]}")
 
-# Initialize logging system after all functions are defined
-logger, current_log_file, log_directory = setup_logging()
+# Logging handlers (and the session log file) are set up by the entry points below,
+# so importing the module doesn't touch the disk before the welcome screen appears
+logger = logging.getLogger(__name__)
 
 # AnnotationState class moved to top level
 
@@ -1141,26 +1649,21 @@ logger, current_log_file, log_directory = setup_logging()
 
 # --- Drawing and event logic ---
 def highlight_thumbnail(index):
-    """Highlights the thumbnail at the given index and un-highlights others."""
-    for i, ax in enumerate(thumb_axes):
-        if i == index:
-            ax.spines['bottom'].set_color('blue')
-            ax.spines['top'].set_color('blue')
-            ax.spines['right'].set_color('blue')
-            ax.spines['left'].set_color('blue')
-            ax.spines['bottom'].set_linewidth(3)
-            ax.spines['top'].set_linewidth(3)
-            ax.spines['right'].set_linewidth(3)
-            ax.spines['left'].set_linewidth(3)
-        else:
-            ax.spines['bottom'].set_color('black')
-            ax.spines['top'].set_color('black')
-            ax.spines['right'].set_color('black')
-            ax.spines['left'].set_color('black')
-            ax.spines['bottom'].set_linewidth(1)
-            ax.spines['top'].set_linewidth(1)
-            ax.spines['right'].set_linewidth(1)
-            ax.spines['left'].set_linewidth(1)
+    """Highlights the thumbnail at the given index and un-highlights the previous one."""
+    previous = highlighted_thumb_idx[0]
+    if previous is None:
+        # First call since the thumbnail axes were created: give every frame the plain style
+        for ax in thumb_axes:
+            for spine in ax.spines.values():
+                spine.set(color='black', linewidth=1)
+    elif previous != index and previous < len(thumb_axes):
+        for spine in thumb_axes[previous].spines.values():
+            spine.set(color='black', linewidth=1)
+    
+    if 0 <= index < len(thumb_axes):
+        for spine in thumb_axes[index].spines.values():
+            spine.set(color='blue', linewidth=3)
+    highlighted_thumb_idx[0] = index
 
 def update_thumbnail_visibility():
     """Update which thumbnails are visible and center them"""
@@ -1226,49 +1729,48 @@ def update_thumbnail_visibility():
     # Center the visible thumbnails with side margins
     start_x = thumb_bbox.x0 + side_margin + (available_width - total_width_needed) / 2
     
+    # Only touch axes whose state actually changes; hidden axes are usually already hidden
     for i, ax in enumerate(thumb_axes):
         if start_idx <= i < end_idx:
-            ax.set_visible(True)
+            if not ax.get_visible():
+                ax.set_visible(True)
+            if not ax.images:
+                thumb = get_thumbnail(image_ids[i], wait=not global_settings.get('progressive_loading', False))
+                if thumb is None:
+                    # Progressive loading: show a blank now, the timer swaps the render in when it's done
+                    thumb = blank_thumbnail
+                    placeholder_thumbs.add(i)
+                    thumbnail_timer[0].start()
+                ax.imshow(thumb)
             visible_idx = i - start_idx
             ax.set_position([start_x + visible_idx * (fixed_thumb_width + fixed_padding),
                              thumb_bbox.y0,
                              fixed_thumb_width,
                              thumb_bbox.height])
-        else:
+        elif ax.get_visible():
             ax.set_visible(False)
+            # Drop the pixels of thumbnails scrolled out of view; the LRU re-supplies them if they come back
+            for image in list(ax.images):
+                image.remove()
+            placeholder_thumbs.discard(i)
     
-    # Update dataset progress text with dynamic sizing
+    prefetch_thumbnails(start_idx, end_idx)
+    
+    # Update dataset progress text (its rounded bbox is sized to the text by matplotlib at draw time)
     if nav_text:
         if total_thumbs > 20:
             # Show percentage for datasets with more than 20 images
             progress_percent = (current_idx + 1) / total_thumbs * 100
-            nav_text.set_text(f'Dataset Progress: {progress_percent:.1f}% ({current_idx + 1}/{total_thumbs})')
+            progress_text = f'Dataset Progress: {progress_percent:.1f}% ({current_idx + 1}/{total_thumbs})'
         else:
             # Show simple progress for smaller datasets
-            nav_text.set_text(f'Dataset Progress: {current_idx + 1}/{total_thumbs}')
-        
-        # Ensure the text is visible
-        nav_text.set_visible(True)
+            progress_text = f'Dataset Progress: {current_idx + 1}/{total_thumbs}'
         
-        # Dynamically resize the text box to fit the content
-        try:
-            # Get the current text and calculate approximate width needed
-            text_content = nav_text.get_text()
-            # Estimate width based on text length and font size
-            estimated_width = len(text_content) * 0.6  # Approximate character width
-            # Ensure minimum and maximum widths
-            estimated_width = max(0.3, min(estimated_width, 0.8))
-            
-            # Get current position and update width
-            current_pos = nav_text.get_position()
-            current_bbox = nav_text.get_bbox_patch()
-            if current_bbox:
-                # Update the bbox width to fit the text
-                current_bbox.set_width(estimated_width)
-                # Center the text box
-                nav_text.set_position((0.5, current_pos[1]))
-        except Exception as e:
-            print(f"⚠ Error resizing dataset progress text box: {e}")
+        # Only touch the artist when the string actually changed
+        if nav_text.get_text() != progress_text:
+            nav_text.set_text(progress_text)
+        if not nav_text.get_visible():
+            nav_text.set_visible(True)
     
     # Update navigation arrows visibility
     try:
@@ -1292,16 +1794,97 @@ def update_thumbnail_visibility():
     
     fig.canvas.draw_idle()
 
+def draw_annotation_markers(state, df_selected):
+    """Rebuild the annotation and CSV mark artists of the shown image as animated overlay artists"""
+    # Clear existing markers safely
+    # Group artists are shared by several entries, so remove each one once
+    for marker in dict.fromkeys(m[0] for m in getattr(state, 'markers', [])):
+        try:
+            if marker:
+                marker.remove()
+        except (NotImplementedError, ValueError):
+            pass  # Ignore errors when removing already removed artists
+    state.markers.clear()
+    
+    # Check which annotations fall inside a box that already has a CSV mark
+    # If so, skip drawing them to avoid duplicates
+    skip_flags = np.zeros(len(state.annotations), dtype=bool)
+    if 'marked' in df.columns and state.annotations:
+        existing_marks = df_selected['marked'].astype(str).str.strip().str.lower()
+        has_mark = ((existing_marks != '') & (existing_marks != 'nan')).to_numpy()
+        if has_mark.any():
+            ann_x = np.array([ann['x'] for ann in state.annotations], dtype=float)
+            ann_y = np.array([ann['y'] for ann in state.annotations], dtype=float)
+            skip_flags = points_in_boxes(ann_x, ann_y, tuple(column[has_mark] for column in state.bounds))
+    
+    # Draw existing annotations (only for new annotations, not existing CSV marks)
+    x_marks = []
+    number_marks = []
+    for ann, skip_drawing in zip(state.annotations, skip_flags):
+        x, y = ann['x'], ann['y']
+        mark_value = ann.get('mark_value', '')
+    
+        if not skip_drawing:
+            label_text = ', '.join(str(ann.get(label_col, '')) for label_col in label_columns)
+            if state.mode == 'number' and ann.get('_is_number', False):
+                number_marks.append((x, y, mark_value, label_text))
+            else:
+                x_marks.append((x, y, mark_value, label_text))
+    
+    # One artist per marker group instead of one Line2D per annotation
+    if x_marks:
+        xs, ys, _, _ = zip(*x_marks)
+        marker = main_ax.scatter(xs, ys, marker='x', c='blue', s=10 ** 2, linewidths=2)
+        state.markers.extend((marker, label_text, x, y, mark_value) for x, y, mark_value, label_text in x_marks)
+    if number_marks:
+        xs, ys, mark_values, _ = zip(*number_marks)
+        marker = scatter_number_markers(main_ax, xs, ys, mark_values, markersize=14)
+        state.markers.extend((marker, label_text, x, y, mark_value) for x, y, mark_value, label_text in number_marks)
+    
+    # Draw existing marks from CSV 'marked' column
+    if 'marked' in df.columns:
+        marks = df_selected['marked'].astype(str).str.strip()
+        marked_values = marks.to_numpy()
+        lowered = marks.str.lower().to_numpy()
+        has_mark = (lowered != '') & (lowered != 'nan')
+        if has_mark.any():
+            centers_x, centers_y = state.centers
+            label_values = [df_selected[label_col].to_numpy() for label_col in label_columns]
+    
+            def mark_entry(marker, i):
+                # Same tuple layout as new annotations, used for hover functionality
+                label_text = ', '.join(str(values[i]) for values in label_values)
+                return (marker, label_text, centers_x[i], centers_y[i], marked_values[i])
+    
+            # "yes" marks are shown as X markers, all of them in one green scatter artist
+            yes_rows = np.flatnonzero(has_mark & (lowered == 'yes'))
+            if len(yes_rows):
+                marker = main_ax.scatter(centers_x[yes_rows], centers_y[yes_rows], marker='x', c='green',
+                                         s=12 ** 2, linewidths=2, zorder=10)
+                state.markers.extend(mark_entry(marker, i) for i in yes_rows)
+    
+            # Other marks are displayed as purple glyphs with high z-order, again in a single artist
+            other_rows = np.flatnonzero(has_mark & (lowered != 'yes'))
+            if len(other_rows):
+                marker = add_text_glyphs(main_ax, centers_x[other_rows], centers_y[other_rows],
+                                         marked_values[other_rows], fontsize=12, color='purple', weight='bold')
+                state.markers.extend(mark_entry(marker, i) for i in other_rows)
+    
+    # Blitted over the cached plot (see blit_overlays), so adding a mark doesn't redraw the boxes and image
+    for marker in dict.fromkeys(m[0] for m in state.markers):
+        marker.set_animated(True)
+
 def draw_main_plot(idx):
     try:
         main_ax.clear()
         img_id = image_ids[idx]
-        df_selected = df[df['image_id'] == img_id].copy()
+        df_selected = get_image_df(img_id)
         
         # Get the annotation state early to avoid scope issues
         state = annotation_states[img_id]
+        x_mins, y_mins, x_maxs, y_maxs = state.bounds
         
-        if df_selected.empty or df_selected['x_min'].isna().all():
+        if df_selected.empty or np.isnan(x_mins).all():
             main_ax.text(0.5, 0.5, "No bounding box data available", 
                          ha='center', va='center', transform=main_ax.transAxes, fontsize=12)
             main_ax.set_title(f'Bounding Boxes for image_id: {img_id}')
@@ -1310,27 +1893,12 @@ def draw_main_plot(idx):
             fig.canvas.draw_idle()
             return
 
-        df_selected['width'] = df_selected['x_max'] - df_selected['x_min']
-        df_selected['height'] = df_selected['y_max'] - df_selected['y_min']
-        df_selected['area'] = df_selected['width'] * df_selected['height']
-        df_selected['center_x'] = (df_selected['x_min'] + df_selected['x_max']) / 2
-        df_selected['center_y'] = (df_selected['y_min'] + df_selected['y_max']) / 2
-        for _, row in df_selected.iterrows():
-            rect = patches.Rectangle(
-                (row['x_min'], row['y_min']),
-                row['width'],
-                row['height'],
-                linewidth=1,
-                edgecolor='r',
-                facecolor='none',
-                zorder=1  # Low z-order so markers appear on top
-            )
-            main_ax.add_patch(rect)
-        
-        x_min_all = df_selected['x_min'].min() if not df_selected['x_min'].isnull().all() else 0
-        x_max_all = df_selected['x_max'].max() if not df_selected['x_max'].isnull().all() else 100
-        y_min_all = df_selected['y_min'].min() if not df_selected['y_min'].isnull().all() else 0
-        y_max_all = df_selected['y_max'].max() if not df_selected['y_max'].isnull().all() else 100
+        add_box_collection(main_ax, state.bounds, linewidth=1)
+        
+        x_min_all = np.nanmin(x_mins)
+        x_max_all = np.nanmax(x_maxs) if not np.isnan(x_maxs).all() else 100
+        y_min_all = np.nanmin(y_mins) if not np.isnan(y_mins).all() else 0
+        y_max_all = np.nanmax(y_maxs) if not np.isnan(y_maxs).all() else 100
 
         # Set axis limits
         main_ax.set_xlim(x_min_all - 10, x_max_all + 10)
@@ -1344,21 +1912,16 @@ def draw_main_plot(idx):
         # Add background image if enabled and available
         if show_background_image[0] and state.image_url:
             try:
-                # Load image if not already loaded
-                if state.image_url not in loaded_images:
-                    img_array = load_image_from_url(state.image_url)
-                    if img_array is not None:
-                        loaded_images[state.image_url] = img_array
-                    else:
-                        print(f"Could not load image from {state.image_url}")
-                        loaded_images[state.image_url] = None
+                # Load image if not already loaded, then warm up the neighbouring plots
+                img_array = get_background_image(state.image_url)
+                prefetch_background_images(idx)
                 
                 # Display background image
-                if loaded_images.get(state.image_url) is not None:
-                    img_array = loaded_images[state.image_url]
+                if img_array is not None:
                     # Invert y-axis for image display (matplotlib vs image coordinates)
+                    # A faded reference layer doesn't need antialiased resampling of every pixel on each redraw
                     main_ax.imshow(img_array, extent=[x_min_all - 10, x_max_all + 10, y_min_all - 10, y_max_all + 10], 
-                                 alpha=0.7, zorder=0)
+                                 alpha=0.7, zorder=0, interpolation='nearest', resample=False)
                     main_ax.set_title(f'Bounding Boxes for image_id: {img_id} (with background image)')
                 else:
                     main_ax.set_title(f'Bounding Boxes for image_id: {img_id}')
@@ -1375,74 +1938,16 @@ def draw_main_plot(idx):
         if radio.value_selected != state.mode:
             radio.set_active(0 if state.mode == 'x' else 1)
         
-        # Clear existing markers safely
-        for marker, *_ in getattr(state, 'markers', []):
-            try:
-                if marker and marker in main_ax.get_children():
-                    marker.remove()
-            except (NotImplementedError, ValueError):
-                pass  # Ignore errors when removing already removed artists
-        state.markers.clear()
-        
         # Clear hover text safely
         if state.hover_text:
             try:
-                if state.hover_text in main_ax.get_children():
-                    state.hover_text.remove()
+                state.hover_text.remove()
             except (NotImplementedError, ValueError):
                 pass
             state.hover_text = None
         
-        # Draw existing annotations (only for new annotations, not existing CSV marks)
-        for ann in state.annotations:
-            x, y = ann['x'], ann['y']
-            mark_value = ann.get('mark_value', '')
-            
-            # Check if this annotation corresponds to an existing CSV mark
-            # If so, skip drawing it to avoid duplicates
-            skip_drawing = False
-            if 'marked' in df.columns:
-                for _, row in df_selected.iterrows():
-                    if (row['x_min'] <= x <= row['x_max'] and 
-                        row['y_min'] <= y <= row['y_max']):
-                        existing_mark = str(row.get('marked', '')).strip()
-                        if existing_mark and existing_mark.lower() != 'nan' and existing_mark.lower() != '':
-                            skip_drawing = True
-                            break
-            
-            if not skip_drawing:
-                if state.mode == 'number' and str(mark_value).isdigit():
-                    marker, = main_ax.plot(x, y, marker=f'${mark_value}$', color='red', markersize=14, mew=2)
-                else:
-                    marker, = main_ax.plot(x, y, marker='x', color='blue', markersize=10, mew=2)
-                label_text = ', '.join(str(ann.get(label_col, '')) for label_col in label_columns)
-                state.markers.append((marker, label_text, x, y, mark_value))
-        
-        # Draw existing marks from CSV 'marked' column
-        if 'marked' in df.columns:
-            for _, row in df_selected.iterrows():
-                marked_value = str(row.get('marked', '')).strip()
-                if marked_value and marked_value.lower() != 'nan' and marked_value.lower() != '':
-                    x, y = (row['x_min'] + row['x_max']) / 2, (row['y_min'] + row['y_max']) / 2
-                    
-                    # Convert "yes" to "x" for display
-                    if marked_value.lower() == 'yes':
-                        display_value = 'x'
-                        marker_color = 'green'  # Different color for existing "yes" marks
-                        marker_size = 12
-                        # Display as X marker with high z-order
-                        marker, = main_ax.plot(x, y, marker='x', color=marker_color, markersize=marker_size, mew=2, zorder=10)
-                    else:
-                        display_value = marked_value
-                        marker_color = 'purple'  # Different color for other existing marks
-                        # Display as text (no X marker) with high z-order
-                        marker = main_ax.text(x, y, display_value, color=marker_color, fontsize=12, 
-                                            ha='center', va='center', weight='bold', zorder=10)
-                    
-                    # Add to markers list for hover functionality
-                    label_text = ', '.join(str(row.get(label_col, '')) for label_col in label_columns)
-                    state.markers.append((marker, label_text, x, y, marked_value))
-            
+        draw_annotation_markers(state, df_selected)
+        
         highlight_thumbnail(idx)
         fig.canvas.draw_idle()
     except Exception as e:
@@ -1502,11 +2007,11 @@ def onclick_main(event):
         
     idx = current_image_idx[0]
     img_id = image_ids[idx]
-    df_selected = df[df['image_id'] == img_id].copy()
     state = annotation_states[img_id]
     x, y = event.xdata, event.ydata
     
-    if df_selected.empty or df_selected['x_min'].isna().all():
+    # Also covers images without rows: all() of an empty array is True
+    if np.isnan(state.bounds[0]).all():
         return
         
     label_text = None
@@ -1514,10 +2019,9 @@ def onclick_main(event):
     mark_value = ''
 
     clicked_bb_index = None
-    for idx_row, row in df_selected.iterrows():
-        if row['x_min'] <= x <= row['x_max'] and row['y_min'] <= y <= row['y_max']:
-            clicked_bb_index = row.name
-            break
+    hit = box_at(state, x, y)
+    if hit is not None:
+        clicked_bb_index = get_image_index(img_id)[hit]
     
     if clicked_bb_index is not None:
         row = df.loc[clicked_bb_index]
@@ -1531,34 +2035,72 @@ def onclick_main(event):
         # Proceed with new annotation only if no existing mark
         if state.mode == 'number':
             mark_value = str(state.counter)
-            df.loc[row.name, 'marked'] = mark_value
+            df.at[row.name, 'marked'] = mark_value
             annotation_entry['mark_value'] = mark_value
+            annotation_entry['_is_number'] = True
             state.counter += 1
             print(f"Added number annotation: {mark_value} at ({x:.1f}, {y:.1f})")
         else:
             mark_value = 'x'
-            df.loc[row.name, 'marked'] = 'yes'
+            df.at[row.name, 'marked'] = 'yes'
             annotation_entry['mark_value'] = mark_value
+            annotation_entry['_is_number'] = False
             print(f"Added X annotation at ({x:.1f}, {y:.1f})")
+        invalidate_thumbnails(img_id)
         
         for label_col in label_columns:
             annotation_entry[label_col] = row[label_col]
         
         state.annotations.append(annotation_entry)
         
-        draw_main_plot(current_image_idx[0])
+        redraw_annotations()
         state.undone.clear()
 
+def draw_overlay_artists(state):
+    """Draw the animated markers and visible hover label of the shown image onto the canvas"""
+    # The help page sits above the plot; painting overlays now would put them on top of it
+    if help_text_box is not None and help_text_box.get_visible():
+        return
+    for marker in dict.fromkeys(m[0] for m in state.markers):
+        if marker.axes is main_ax:  # Skip artists already cleared off the axes
+            fig.draw_artist(marker)
+    if state.hover_text and state.hover_text.get_visible():
+        fig.draw_artist(state.hover_text)
+
+def on_draw_main(event):
+    """Cache the freshly drawn figure so markers and hover labels can be blitted over it"""
+    plot_background[0] = fig.canvas.copy_from_bbox(fig.bbox)
+    # Animated artists are skipped by full draws, so put them back on top
+    state = annotation_states.get(image_ids[current_image_idx[0]]) if image_ids else None
+    if state:
+        draw_overlay_artists(state)
+
+def blit_overlays(state):
+    """Repaint only the markers and hover label over the cached background instead of redrawing the figure"""
+    if plot_background[0] is None or not fig.canvas.supports_blit:
+        fig.canvas.draw_idle()
+        return
+    fig.canvas.restore_region(plot_background[0])
+    draw_overlay_artists(state)
+    fig.canvas.blit(fig.bbox)
+
+def redraw_annotations():
+    """Rebuild the shown image's markers after an annotation change, leaving boxes and background as drawn"""
+    img_id = image_ids[current_image_idx[0]]
+    state = annotation_states[img_id]
+    draw_annotation_markers(state, get_image_df(img_id))
+    blit_overlays(state)
+
 def on_motion_main(event):
     if not labels_enabled[0]:
-        print(f"⚠ Labels disabled (labels_enabled[0] = {labels_enabled[0]})")
         idx = current_image_idx[0]
         img_id = image_ids[idx]
         state = annotation_states[img_id]
-        if state.hover_text:
+        # Repaint only when there is a label left to hide, not on every mouse move
+        if state.hover_text and state.hover_text.get_visible():
             try:
                 state.hover_text.set_visible(False)
-                fig.canvas.draw_idle()
+                blit_overlays(state)
             except (NotImplementedError, ValueError):
                 pass
         return
@@ -1569,13 +2111,12 @@ def on_motion_main(event):
     idx = current_image_idx[0]
     img_id = image_ids[idx]
     state = annotation_states[img_id]
-    df_selected = df[df['image_id'] == img_id].copy()
     
     if event.inaxes != main_ax:
         if state.hover_text:
             try:
                 state.hover_text.set_visible(False)
-                fig.canvas.draw_idle()
+                blit_overlays(state)
             except (NotImplementedError, ValueError):
                 pass
         return
@@ -1583,82 +2124,73 @@ def on_motion_main(event):
     show_label = False
     x, y = event.xdata, event.ydata
     
-    for idx_row, row in df_selected.iterrows():
-        if row['x_min'] <= x <= row['x_max'] and row['y_min'] <= y <= row['y_max']:
-            print(f"🔍 Found bounding box at ({x:.1f}, {y:.1f})")
-            label_lines = []
-            for label_col in label_columns:
-                if label_col in row and str(row[label_col]).strip() and str(row[label_col]).lower() != 'nan':
-                    display_name = label_col.replace('label_', '')
-                    label_lines.append(f"{display_name}: {row[label_col]}")
-                    print(f"  ✓ Found label: {label_col} = {row[label_col]}")
-                else:
-                    print(f"  ⚠ No label in {label_col}: {row.get(label_col, 'N/A')}")
+    hit = box_at(state, x, y)
+    if hit is not None:
+        print(f"🔍 Found bounding box at ({x:.1f}, {y:.1f})")
+        # Label lines were formatted once at load time
+        hover_text = state.hover_labels[hit]
+        
+        # Only show hover text if there are actual labels
+        if hover_text:
+            print(f"  🎯 Creating hover text with {hover_text.count(chr(10)) + 1} labels")
             
-            # Only show hover text if there are actual labels
-            if label_lines:
-                print(f"  🎯 Creating hover text with {len(label_lines)} labels")
-                hover_text = '\n'.join(label_lines)
-                
-                # Adjust position to ensure hover text is visible and not cut off by controls
-                # Move text slightly to the left to avoid overlapping with right-side controls
-                adjusted_x = x - 50  # Move left by 50 pixels
-                adjusted_y = y + 20  # Move up by 20 pixels
-                
-                # Debug: Check plot limits and positioning
-                xlim = main_ax.get_xlim()
-                ylim = main_ax.get_ylim()
-                print(f"  📏 Plot limits: X({xlim[0]:.1f}, {xlim[1]:.1f}), Y({ylim[0]:.1f}, {ylim[1]:.1f})")
-                print(f"  📍 Text position: ({adjusted_x:.1f}, {adjusted_y:.1f})")
-                print(f"  🎯 Mouse position: ({x:.1f}, {y:.1f})")
-                
-                if state.hover_text is None:
-                    try:
-                        print(f"  🎨 Creating new hover text at ({adjusted_x:.1f}, {adjusted_y:.1f})")
-                        # Restore original label format with white box and blue text
-                        state.hover_text = main_ax.text(adjusted_x, adjusted_y, hover_text, 
-                                                      color='blue', fontsize=10, va='bottom', ha='left', 
-                                                      bbox=dict(facecolor='white', alpha=0.98, edgecolor='black', boxstyle='round,pad=0.5'),
-                                                      zorder=10000)  # Extremely high z-order to appear above everything
-                        print(f"  ✅ Hover text created: {state.hover_text}")
-                        print(f"  🔍 Text properties: visible={state.hover_text.get_visible()}, alpha={state.hover_text.get_alpha()}")
-                    except (NotImplementedError, ValueError) as e:
-                        print(f"  ❌ Error creating hover text: {e}")
-                        pass
-                else:
-                    try:
-                        print(f"  🔄 Updating existing hover text at ({adjusted_x:.1f}, {adjusted_y:.1f})")
-                        state.hover_text.set_position((adjusted_x, adjusted_y))
-                        state.hover_text.set_text(hover_text)
-                        state.hover_text.set_visible(True)
-                        # Ensure the text maintains high z-order and proper styling
-                        state.hover_text.set_zorder(10000)
-                        print(f"  ✅ Hover text updated: {state.hover_text}")
-                        print(f"  🔍 Text properties: visible={state.hover_text.get_visible()}, alpha={state.hover_text.get_alpha()}")
-                    except (NotImplementedError, ValueError) as e:
-                        print(f"  ❌ Error updating hover text: {e}")
-                        pass
-                print(f"  🎭 Calling fig.canvas.draw()")
-                fig.canvas.draw()  # Force full redraw instead of just draw_idle()
-                show_label = True
-                break
+            # Adjust position to ensure hover text is visible and not cut off by controls
+            # Move text slightly to the left to avoid overlapping with right-side controls
+            adjusted_x = x - 50  # Move left by 50 pixels
+            adjusted_y = y + 20  # Move up by 20 pixels
+            
+            # Debug: Check plot limits and positioning
+            xlim = main_ax.get_xlim()
+            ylim = main_ax.get_ylim()
+            print(f"  📏 Plot limits: X({xlim[0]:.1f}, {xlim[1]:.1f}), Y({ylim[0]:.1f}, {ylim[1]:.1f})")
+            print(f"  📍 Text position: ({adjusted_x:.1f}, {adjusted_y:.1f})")
+            print(f"  🎯 Mouse position: ({x:.1f}, {y:.1f})")
             
-            # If no labels, don't show any hover text
+            if state.hover_text is None:
+                try:
+                    print(f"  🎨 Creating new hover text at ({adjusted_x:.1f}, {adjusted_y:.1f})")
+                    # Restore original label format with white box and blue text
+                    state.hover_text = main_ax.text(adjusted_x, adjusted_y, hover_text, 
+                                                  color='blue', fontsize=10, va='bottom', ha='left', 
+                                                  bbox=dict(facecolor='white', alpha=0.98, edgecolor='black', boxstyle='round,pad=0.5'),
+                                                  zorder=10000,  # Extremely high z-order to appear above everything
+                                                  animated=True)  # Drawn by blit_overlays, not by full redraws
+                    print(f"  ✅ Hover text created: {state.hover_text}")
+                    print(f"  🔍 Text properties: visible={state.hover_text.get_visible()}, alpha={state.hover_text.get_alpha()}")
+                except (NotImplementedError, ValueError) as e:
+                    print(f"  ❌ Error creating hover text: {e}")
+                    pass
             else:
-                if state.hover_text:
-                    try:
-                        state.hover_text.set_visible(False)
-                        fig.canvas.draw_idle()
-                    except (NotImplementedError, ValueError):
-                        pass
-                show_label = False
-                break
+                try:
+                    print(f"  🔄 Updating existing hover text at ({adjusted_x:.1f}, {adjusted_y:.1f})")
+                    state.hover_text.set_position((adjusted_x, adjusted_y))
+                    state.hover_text.set_text(hover_text)
+                    state.hover_text.set_visible(True)
+                    # Ensure the text maintains high z-order and proper styling
+                    state.hover_text.set_zorder(10000)
+                    print(f"  ✅ Hover text updated: {state.hover_text}")
+                    print(f"  🔍 Text properties: visible={state.hover_text.get_visible()}, alpha={state.hover_text.get_alpha()}")
+                except (NotImplementedError, ValueError) as e:
+                    print(f"  ❌ Error updating hover text: {e}")
+                    pass
+            blit_overlays(state)
+            show_label = True
+        
+        # If no labels, don't show any hover text
+        else:
+            if state.hover_text:
+                try:
+                    state.hover_text.set_visible(False)
+                    blit_overlays(state)
+                except (NotImplementedError, ValueError):
+                    pass
+            show_label = False
     
     # If no labels were found in any bounding box, hide hover text
     if not show_label and state.hover_text:
         try:
             state.hover_text.set_visible(False)
-            fig.canvas.draw_idle()
+            blit_overlays(state)
         except (NotImplementedError, ValueError):
             pass
 
@@ -1671,7 +2203,7 @@ def on_mode(label):
         state.mode = label
     
     # Update the current plot display
-    draw_main_plot(current_image_idx[0])
+    redraw_annotations()
     
     print(f"✓ Mode '{label}' applied to all {len(annotation_states)} plots")
 
@@ -1684,7 +2216,7 @@ def on_reset(event):
         state.counter = 1
     
     # Update the current plot display
-    draw_main_plot(current_image_idx[0])
+    redraw_annotations()
     
     print(f"✓ Counter reset to 1 for all {len(annotation_states)} plots")
 
@@ -1700,16 +2232,17 @@ def on_undo(event):
         # Find the bounding box that was annotated and clear its 'marked' value
         if 'mark_value' in ann:
             # For number annotations, we need to find the row with that mark value
-            if str(ann['mark_value']).isdigit():
+            if ann.get('_is_number', False):
                 # Find rows with this mark value and clear them
-                mask = (df['image_id'] == img_id) & (df['marked'] == ann['mark_value'])
-                df.loc[mask, 'marked'] = ''
+                marks = df['marked'].iloc[image_row_indices[img_id]]
+                df.loc[marks.index[marks == ann['mark_value']], 'marked'] = ''
             else:
                 # For 'x' annotations, find rows marked as 'yes' and clear them
-                mask = (df['image_id'] == img_id) & (df['marked'] == 'yes')
-                df.loc[mask, 'marked'] = ''
+                marks = df['marked'].iloc[image_row_indices[img_id]]
+                df.loc[marks.index[marks == 'yes'], 'marked'] = ''
+            invalidate_thumbnails(img_id)
         
-        draw_main_plot(current_image_idx[0])
+        redraw_annotations()
 
 def on_redo(event):
     idx = current_image_idx[0]
@@ -1724,25 +2257,25 @@ def on_redo(event):
             # Find the bounding box coordinates and update the 'marked' column
             x, y = ann['x'], ann['y']
             # Find the row that contains these coordinates
-            df_selected = df[df['image_id'] == img_id]
-            for idx_row, row in df_selected.iterrows():
-                if (row['x_min'] <= x <= row['x_max'] and 
-                    row['y_min'] <= y <= row['y_max']):
-                    if str(ann['mark_value']).isdigit():
-                        df.loc[idx_row, 'marked'] = ann['mark_value']
-                    else:
-                        df.loc[idx_row, 'marked'] = 'yes'
-                    break
+            hit = box_at(state, x, y)
+            if hit is not None:
+                idx_row = get_image_index(img_id)[hit]
+                if ann.get('_is_number', False):
+                    df.at[idx_row, 'marked'] = ann['mark_value']
+                else:
+                    df.at[idx_row, 'marked'] = 'yes'
+                invalidate_thumbnails(img_id)
         
-        draw_main_plot(current_image_idx[0])
+        redraw_annotations()
 
 def on_clear(event):
     idx = current_image_idx[0]
     img_id = image_ids[idx]
     state = annotation_states[img_id]
     state.reset()
-    df.loc[df['image_id'] == img_id, 'marked'] = ''
-    draw_main_plot(current_image_idx[0])
+    df.loc[get_image_index(img_id), 'marked'] = ''
+    invalidate_thumbnails(img_id)
+    redraw_annotations()
 
 def on_toggle_labels(event):
     labels_enabled[0] = not labels_enabled[0]
@@ -1791,12 +2324,10 @@ def on_flip_y(event):
     else:
         btn_flip_y.label.set_text('Flip Y-Axis')
     
-    # Regenerate thumbnails with new Y-axis orientation
-    global thumbnails
-    thumbnails = []
-    for img_id in image_ids:
-        df_sel = df[df['image_id'] == img_id]
-        thumbnails.append(generate_thumbnail(df_sel))
+    # Only the thumbnails on screen hold an image; the rest pick up the new orientation when shown
+    for img_id, ax in zip(image_ids, thumb_axes):
+        if ax.images:
+            ax.images[0].set_data(get_thumbnail(img_id))
     
     # Update thumbnail display and redraw main plot
     update_thumbnail_visibility()
@@ -1826,7 +2357,8 @@ def save_annotations(event=None):
         
         if annotations:
             # Create annotations DataFrame with all relevant information
-            annotations_df = pd.DataFrame(annotations)
+            # '_is_number' is an internal drawing flag, not part of the export
+            annotations_df = pd.DataFrame(annotations).drop(columns='_is_number', errors='ignore')
             
             # Save annotations file
             annotations_path = os.path.join(output_dir, 'annotations_marked.csv')
@@ -1858,105 +2390,148 @@ def save_annotations(event=None):
             print(f"  Output directory: {output_dir}")
             print(f"  Current working directory: {os.getcwd()}")
 
-def save_all_annotated_plots():
-    for img_id in image_ids:
-        df_selected = df[df['image_id'] == img_id].copy()
-        fig, ax = plt.subplots(figsize=(6, 6))
-        
-        if not df_selected.empty and not df_selected['x_min'].isna().all():
-            df_selected['width'] = df_selected['x_max'] - df_selected['x_min']
-            df_selected['height'] = df_selected['y_max'] - df_selected['y_min']
-            for _, row in df_selected.iterrows():
-                rect = patches.Rectangle(
-                    (row['x_min'], row['y_min']),
-                    row['width'],
-                    row['height'],
-                    linewidth=1,
-                    edgecolor='r',
-                    facecolor='none',
-                    zorder=1  # Low z-order so markers appear on top
-                )
-                ax.add_patch(rect)
-            
-            x_min_all = df_selected['x_min'].min()
-            x_max_all = df_selected['x_max'].max()
-            y_min_all = df_selected['y_min'].min()
-            y_max_all = df_selected['y_max'].max()
-            ax.set_xlim(x_min_all - 10, x_max_all + 10)
-            
-            # Apply Y-axis flip if enabled
-            if y_axis_flipped[0]:
-                ax.set_ylim(y_max_all + 10, y_min_all - 10)
-            else:
-                ax.set_ylim(y_min_all - 10, y_max_all + 10)
+def save_annotated_plot(img_id):
+    """Build and save the annotated plot of one image"""
+    df_selected = get_image_df(img_id)
+    state = annotation_states[img_id]
+    x_mins, y_mins, x_maxs, y_maxs = state.bounds
+    # Agg-only figure so plots can be saved from the background close thread
+    fig = Figure(figsize=(6, 6))
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot(111)
+    
+    if not np.isnan(x_mins).all():
+        # Same cached arrays the main plot draws from, no per-image column extraction
+        add_box_collection(ax, state.bounds, linewidth=1)
+        
+        x_min_all = np.nanmin(x_mins)
+        x_max_all = np.nanmax(x_maxs) if not np.isnan(x_maxs).all() else 100
+        y_min_all = np.nanmin(y_mins) if not np.isnan(y_mins).all() else 0
+        y_max_all = np.nanmax(y_maxs) if not np.isnan(y_maxs).all() else 100
+        ax.set_xlim(x_min_all - 10, x_max_all + 10)
+        
+        # Apply Y-axis flip if enabled
+        if y_axis_flipped[0]:
+            ax.set_ylim(y_max_all + 10, y_min_all - 10)
         else:
-            ax.text(0.5, 0.5, "No bounding box data available", 
-                    ha='center', va='center', transform=ax.transAxes, fontsize=12)
-            ax.set_xticks([])
-            ax.set_yticks([])
+            ax.set_ylim(y_min_all - 10, y_max_all + 10)
+    else:
+        ax.text(0.5, 0.5, "No bounding box data available", 
+                ha='center', va='center', transform=ax.transAxes, fontsize=12)
+        ax.set_xticks([])
+        ax.set_yticks([])
+
+    x_marks = []
+    number_marks = []
+    for ann in state.annotations:
+        mark_value = ann.get('mark_value', '')
+        if state.mode == 'number' and ann.get('_is_number', False):
+            number_marks.append((ann['x'], ann['y'], mark_value))
+        else:
+            x_marks.append((ann['x'], ann['y']))
+    if x_marks:
+        xs, ys = zip(*x_marks)
+        ax.scatter(xs, ys, marker='x', c='blue', s=10 ** 2, linewidths=2)
+    if number_marks:
+        xs, ys, mark_values = zip(*number_marks)
+        scatter_number_markers(ax, xs, ys, mark_values, markersize=10)
+    
+    # Add existing marks from CSV 'marked' column to saved plots
+    if 'marked' in df.columns:
+        marks = df_selected['marked'].astype(str).str.strip()
+        marked_values = marks.to_numpy()
+        lowered = marks.str.lower().to_numpy()
+        has_mark = (lowered != '') & (lowered != 'nan')
+        if has_mark.any():
+            centers_x, centers_y = state.centers
+            
+            # "yes" marks as green X markers, other marks as purple glyphs, one artist each
+            yes_rows = has_mark & (lowered == 'yes')
+            if yes_rows.any():
+                ax.scatter(centers_x[yes_rows], centers_y[yes_rows], marker='x', c='green',
+                           s=10 ** 2, linewidths=2, zorder=10)
+            other_rows = has_mark & (lowered != 'yes')
+            if other_rows.any():
+                add_text_glyphs(ax, centers_x[other_rows], centers_y[other_rows],
+                                marked_values[other_rows], fontsize=10, color='purple', weight='light')
+    
+    ax.set_xlabel('X')
+    ax.set_ylabel('Y')
+    ax.set_title(f'Bounding Boxes for image_id: {img_id}')
+    fig.savefig(os.path.join(output_dir, f'annotated_{img_id}.png'))
 
-        state = annotation_states[img_id]
-        for ann in state.annotations:
-            x, y = ann['x'], ann['y']
-            mark_value = ann.get('mark_value', '')
-            if state.mode == 'number' and str(mark_value).isdigit():
-                ax.plot(x, y, marker=f'${mark_value}$', color='red', markersize=10, mew=2)
-            else:
-                ax.plot(x, y, marker='x', color='blue', markersize=10, mew=2)
-        
-        # Add existing marks from CSV 'marked' column to saved plots
-        if 'marked' in df.columns:
-            for _, row in df_selected.iterrows():
-                marked_value = str(row.get('marked', '')).strip()
-                if marked_value and marked_value.lower() != 'nan' and marked_value.lower() != '':
-                    x, y = (row['x_min'] + row['x_max']) / 2, (row['y_min'] + row['y_max']) / 2
-                    
-                    # Convert "yes" to "x" for display
-                    if marked_value.lower() == 'yes':
-                        display_value = 'x'
-                        marker_color = 'green'  # Different color for existing "yes" marks
-                        marker_size = 10
-                        # Display as X marker with high z-order
-                        ax.plot(x, y, marker='x', color=marker_color, markersize=marker_size, mew=2, zorder=10)
-                    else:
-                        display_value = marked_value
-                        marker_color = 'purple'  # Different color for other existing marks
-                        # Display as text (no X marker) with high z-order
-                        ax.text(x, y, display_value, color=marker_color, fontsize=10, 
-                               ha='center', va='center', weight='light', zorder=10)
-        
-        ax.set_xlabel('X')
-        ax.set_ylabel('Y')
-        ax.set_title(f'Bounding Boxes for image_id: {img_id}')
-        out_path = os.path.join(output_dir, f'annotated_{img_id}.png')
-        plt.savefig(out_path)
-        plt.close(fig)
+def save_all_annotated_plots():
+    # Each worker builds, saves and drops its own figure, so at most max_workers figures
+    # are alive at once; PNG encoding releases the GIL, so the pool still runs in parallel
+    failed = []
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        futures = {executor.submit(save_annotated_plot, img_id): img_id for img_id in image_ids}
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception:
+                failed.append(futures[future])
+                logger.exception(f"Saving the annotated plot for image_id {futures[future]} failed")
+    if failed:
+        raise RuntimeError(f"{len(failed)} of {len(image_ids)} annotated plots could not be saved")
     print(f"All annotated plots saved to {output_dir}")
 
 def on_close(event=None):
-    """Save all data when closing the program"""
+    """Save all data when closing the program without blocking the window from closing"""
+    global close_save_thread
+    
     logger.info("Program closing, saving all data...")
     print("Saving all data before closing...")
     
+    # Non-daemon thread: the interpreter still waits for the save to finish before exiting
+    close_save_thread = threading.Thread(target=save_all_data, name="close-save")
+    close_save_thread.start()
+
+def wait_for_pending_save():
+    """Block until a background close-time save has finished"""
+    if close_save_thread is not None and close_save_thread.is_alive():
+        logger.info("Waiting for previous session data to finish saving...")
+        close_save_thread.join()
+
+def save_all_data():
+    """Save annotation CSV files, then plots (if enabled), and clean up logs"""
+    # The CSVs come first: they are the one output that can't be recreated from the input file
+    saved = True
+    logger.info("Saving annotation data...")
+    try:
+        save_annotations()
+    except Exception as e:
+        saved = False
+        logger.exception("Saving annotation data failed")
+        print(f"✗ Error saving annotation data: {e}")
+    
     # Check if plots should be saved based on settings
     if global_settings.get('save_plots_on_close', True):
-        # Save annotated plots
+        # Save annotated plots; this runs on the close thread, so failures must be logged here
         logger.info("Saving annotated plots...")
-        save_all_annotated_plots()
-        print("✓ Plots saved successfully")
+        try:
+            save_all_annotated_plots()
+            print("✓ Plots saved successfully")
+        except Exception as e:
+            saved = False
+            logger.exception("Saving annotated plots failed")
+            print(f"✗ Error saving annotated plots: {e}")
     else:
         logger.info("Plot saving disabled by settings")
         print("ℹ Plot saving disabled by settings")
     
-    # Save annotation CSV files
-    logger.info("Saving annotation data...")
-    save_annotations()
-    
     # Clean up old logs before closing
-    cleanup_old_logs()
+    try:
+        cleanup_old_logs()
+    except Exception:
+        logger.exception("Log cleanup failed")
     
-    logger.info("All data saved successfully, program closing")
-    print("✓ All data saved successfully!")
+    if saved:
+        logger.info("All data saved successfully, program closing")
+        print("✓ All data saved successfully!")
+    else:
+        logger.error(f"Some data could not be saved, see the errors above (output directory: {output_dir})")
+        print("⚠ Some data could not be saved, see the errors above")
     print("✓ Program closing...")
 
 # Old return_to_welcome function removed - now using modular approach
@@ -1976,7 +2551,6 @@ except Exception as e:
     print(f"✗ Error during final initialization: {e}")
     print("Attempting to save error information...")
     try:
-        import traceback
         with open('plotter_error.log', 'w') as f:
             f.write(f"Error: {e}\n")
             f.write("Traceback:\n")
@@ -2046,10 +2620,13 @@ def main_program_loop():
 
 def process_csv_file(file_path):
     """Process a single CSV file - this contains the main plotting logic"""
-    global df, output_dir, image_ids, annotation_states, thumbnails, thumb_axes, current_image_idx, label_columns, image_url_columns
+    global df, output_dir, image_ids, image_row_indices, annotation_states, thumb_axes, current_image_idx, label_columns, image_url_columns
     
     logger.info(f"Starting CSV processing: {file_path}")
     
+    # Don't swap out the session globals while the previous session is still being saved
+    wait_for_pending_save()
+    
     # Set output directory to input file's directory
     output_dir = os.path.dirname(file_path)
     # Create a timestamped subfolder for all outputs
@@ -2082,14 +2659,32 @@ def process_csv_file(file_path):
     
     # Load your data
     logger.info("Loading CSV data...")
-    df = pd.read_csv(file_path)
+    # Only the box coordinates are parsed as numbers. Every other column, 'marked' included, is read
+    # as text so IDs, dates and labels round-trip exactly as written ('007' stays '007' with either
+    # reader); the header is read up front to know which columns those are
+    text_columns = [col for col in pd.read_csv(file_path, nrows=0).columns
+                    if col not in ('x_min', 'x_max', 'y_min', 'y_max')]
+    # PyArrow's multithreaded parser is much faster on large files when it's installed.
+    # It is called directly because pandas' pyarrow engine only applies dtype after inferring types
+    df = None
+    if pa is not None:
+        try:
+            import pyarrow.csv as pa_csv
+            convert_options = pa_csv.ConvertOptions(column_types={col: pa.string() for col in text_columns},
+                                                    strings_can_be_null=True)
+            df = pa_csv.read_csv(file_path, convert_options=convert_options).to_pandas()
+        except Exception as e:
+            logger.warning(f"PyArrow CSV reader failed ({e}), falling back to pandas")
+            print(f"⚠ PyArrow CSV reader failed ({e}), falling back to pandas")
+    if df is None:
+        df = pd.read_csv(file_path, dtype={col: str for col in text_columns})
     logger.info(f"CSV loaded successfully: {len(df)} rows, {len(df.columns)} columns")
     
     # Ensure bounding box columns are numeric, coerce errors to NaN
-    df['x_min'] = pd.to_numeric(df['x_min'], errors='coerce')
-    df['x_max'] = pd.to_numeric(df['x_max'], errors='coerce')
-    df['y_min'] = pd.to_numeric(df['y_min'], errors='coerce')
-    df['y_max'] = pd.to_numeric(df['y_max'], errors='coerce')
+    # Columns that already parsed as numbers skip the second pass
+    for col in ('x_min', 'x_max', 'y_min', 'y_max'):
+        if not pd.api.types.is_numeric_dtype(df[col]):
+            df[col] = pd.to_numeric(df[col], errors='coerce')
     
     # Create output directory for plots
     os.makedirs(output_dir, exist_ok=True)
@@ -2097,6 +2692,9 @@ def process_csv_file(file_path):
     # Add a 'marked' column to the DataFrame, default to empty string
     if 'marked' not in df.columns:
         df['marked'] = ''
+    else:
+        # Normalise to strings so new marks never hit a float/NaN column
+        df['marked'] = df['marked'].fillna('').astype(str)
     
     # Find all label columns
     label_columns = [col for col in df.columns if col.startswith('label_')]
@@ -2109,12 +2707,10 @@ def process_csv_file(file_path):
     for col in df.columns:
         if any(keyword in col.lower() for keyword in ['url', 'link', 'image', 'img', 'src']):
             # Check if the column contains URLs
-            sample_values = df[col].dropna().head(10)
-            if len(sample_values) > 0:
-                # Check if at least some values look like URLs
-                url_count = sum(1 for val in sample_values if str(val).startswith(('http://', 'https://', 'www.')))
-                if url_count > 0:
-                    image_url_columns.append(col)
+            # Check if at least some of the first non-empty values look like URLs
+            sample_values = df[col].dropna().head(10).astype(str)
+            if sample_values.str.match(URL_PATTERN).any():
+                image_url_columns.append(col)
     
     logger.info(f"Detected image URL columns: {image_url_columns}")
     print(f"Detected potential image URL columns: {image_url_columns}")
@@ -2126,53 +2722,52 @@ def process_csv_file(file_path):
     apply_global_settings()
     
     # Prepare per-image annotation state
-    df['image_id'] = df['image_id'].astype(str)
+    # Categorical ids turn the per-image equality masks into integer code compares
+    df['image_id'] = df['image_id'].astype(str).astype('category')
     image_ids = list(df['image_id'].unique())
+    # Images whose rows are contiguous in the file get a slice (a view) instead of an index array
+    image_row_indices = {}
+    for img_id, rows in df.groupby('image_id', sort=False, observed=True).indices.items():
+        contiguous = rows[-1] - rows[0] + 1 == len(rows)
+        image_row_indices[img_id] = slice(rows[0], rows[-1] + 1) if contiguous else rows
     annotation_states = {img_id: AnnotationState() for img_id in image_ids}
+    
+    # Cache each image's box coordinates and hover text once so redraws and mouse moves skip that work
+    bounds = box_bounds(df)
+    centers = ((bounds[0] + bounds[2]) / 2, (bounds[1] + bounds[3]) / 2)
+    hover_labels = build_hover_labels(df)
+    for img_id, rows in image_row_indices.items():
+        annotation_states[img_id].bounds = tuple(column[rows] for column in bounds)
+        annotation_states[img_id].centers = tuple(column[rows] for column in centers)
+        annotation_states[img_id].hover_labels = hover_labels[rows]
     logger.info(f"Created annotation states for {len(image_ids)} unique images")
     
-    # Store image URLs for each image_id
-    for img_id in image_ids:
-        df_sel = df[df['image_id'] == img_id]
-        if not df_sel.empty and image_url_columns:
-            # Get the first non-null URL from any image URL column
-            for url_col in image_url_columns:
-                url = df_sel[url_col].dropna().iloc[0] if not df_sel[url_col].dropna().empty else None
-                if url:
-                    annotation_states[img_id].image_url = url
-                    break
+    # Store each image's URL: the first non-null value per URL column, taken from one groupby pass
+    if image_url_columns:
+        first_urls = df.groupby('image_id', sort=False, observed=True)[image_url_columns].first()
+        for img_id, urls in zip(first_urls.index, first_urls.itertuples(index=False, name=None)):
+            # Stray whitespace would otherwise cache and download the same image twice
+            url = next((str(u).strip() for u in urls if pd.notna(u) and str(u).strip()), None)
+            if url:
+                annotation_states[img_id].image_url = url
     
     # Pre-populate annotation states from 'marked' column if it exists
     if 'marked' in df.columns:
-        for img_id in image_ids:
-            state = annotation_states[img_id]
-            df_sel = df[df['image_id'] == img_id]
-            for idx, row in df_sel.iterrows():
-                mark_val = str(row['marked']).strip()
-                if mark_val and mark_val.lower() != 'nan' and mark_val.lower() != 'yes':
-                    try:
-                        ann = {'image_id': img_id, 'x': (row['x_min'] + row['x_max']) / 2, 'y': (row['y_min'] + row['y_max']) / 2}
-                        if mark_val.isdigit():
-                            ann['mark_value'] = mark_val
-                            # Don't set mode here, let user control it
-                        else:
-                            ann['mark_value'] = 'x'
-                            # Don't set mode here, let user control it
-                        for label_col in [col for col in df.columns if col.startswith('label_')]:
-                            ann[label_col] = row[label_col]
-                        state.annotations.append(ann)
-                    except Exception as e:
-                        logger.warning(f"Could not process existing annotation for row {idx}: {e}")
-                        print(f"Warning: Could not process existing annotation for row {idx}: {e}")
-                elif mark_val and mark_val.lower() == 'yes':
-                    try:
-                        ann = {'image_id': img_id, 'x': (row['x_min'] + row['x_max']) / 2, 'y': (row['y_min'] + row['y_max']) / 2, 'mark_value': 'x'}
-                        for label_col in [col for col in df.columns if col.startswith('label_')]:
-                            ann[label_col] = row[label_col]
-                        state.annotations.append(ann)
-                    except Exception as e:
-                        logger.warning(f"Could not process existing annotation for row {idx}: {e}")
-                        print(f"Warning: Could not process existing annotation for row {idx}: {e}")
+        # Classify every row at once: numbered marks keep their value, anything else counts as an X
+        mark_str = df['marked'].astype(str).str.strip()
+        has_mark = (mark_str != '') & (mark_str.str.lower() != 'nan')
+        is_number = mark_str.str.isdigit()
+        marked_rows = df.loc[has_mark]
+        ann_df = pd.DataFrame({
+            'image_id': marked_rows['image_id'].astype(str),
+            'x': centers[0][has_mark.to_numpy()],
+            'y': centers[1][has_mark.to_numpy()],
+            '_is_number': is_number[has_mark],
+            'mark_value': mark_str[has_mark].where(is_number[has_mark], 'x'),
+        })
+        ann_df = ann_df.join(marked_rows[label_columns])
+        for img_id, group in ann_df.groupby('image_id', sort=False):
+            annotation_states[img_id].annotations.extend(group.to_dict('records'))
     
     logger.info("Starting plotting interface creation...")
     # Generate thumbnails and create the main plotting interface
@@ -2183,85 +2778,43 @@ def process_csv_file(file_path):
 
 def create_plotting_interface():
     """Create the main plotting interface"""
-    global thumbnails, thumb_axes, current_image_idx
-    
-    # Generate thumbnails for each image
-    thumbnails = []
-    print("Creating thumbnails...")
-    
-    # Apply progressive loading if enabled
-    if global_settings.get('progressive_loading', False):
-        print("ℹ Progressive thumbnail loading enabled for low-end devices")
-        # Create placeholder thumbnails first
-        for i, img_id in enumerate(image_ids):
-            try:
-                # Create a simple placeholder
-                placeholder = np.zeros((200, 200, 4), dtype=np.uint8)
-                placeholder[:, :, 3] = 255  # Full alpha
-                thumbnails.append(placeholder)
-            except:
-                thumbnails.append(np.zeros((200, 200, 4), dtype=np.uint8))
-        
-        # Load thumbnails progressively in background
-        def load_thumbnail_progressive(img_id, index):
-            try:
-                df_sel = df[df['image_id'] == img_id]
-                thumb = generate_thumbnail(df_sel)
-                thumbnails[index] = thumb
-                # Update display if this thumbnail is currently visible
-                if index == current_image_idx[0]:
-                    update_thumbnail_visibility()
-                print(f"  ✓ Loaded thumbnail {index+1}/{len(image_ids)}")
-            except Exception as e:
-                print(f"✗ Error creating thumbnail for {img_id}: {e}")
-        
-        # Start progressive loading
-        for i, img_id in enumerate(image_ids):
-            # Load first few thumbnails immediately
-            if i < 5:
-                load_thumbnail_progressive(img_id, i)
-            else:
-                # Schedule others to load later
-                root.after(100 * i, lambda idx=i, img=img_id: load_thumbnail_progressive(img, idx))
-        
-        print(f"✓ Created {len(thumbnails)} placeholder thumbnails (progressive loading enabled)")
-    else:
-        # Standard loading for high-end devices
-        for i, img_id in enumerate(image_ids):
-            try:
-                df_sel = df[df['image_id'] == img_id]
-                thumb = generate_thumbnail(df_sel)
-                thumbnails.append(thumb)
-                if (i + 1) % 10 == 0:
-                    print(f"  Created {i + 1}/{len(image_ids)} thumbnails")
-            except Exception as e:
-                print(f"✗ Error creating thumbnail for {img_id}: {e}")
-                # Create a blank thumbnail as fallback
-                try:
-                    fig, ax = plt.subplots(figsize=(2, 2))
-                    ax.axis('off')
-                    fig.canvas.draw()
-                    blank_thumb = np.array(fig.canvas.renderer.buffer_rgba())
-                    plt.close(fig)
-                    thumbnails.append(blank_thumb)
-                except:
-                    # Last resort: create a simple array
-                    thumbnails.append(np.zeros((200, 200, 4), dtype=np.uint8))
-        print(f"✓ Created {len(thumbnails)} thumbnails")
+    # Thumbnails are rendered when they first scroll into view (see update_thumbnail_visibility),
+    # so start-up no longer scales with the number of images
+    thumbnail_cache.clear()
+    for future in pending_thumbnails.values():
+        future.cancel()
+    pending_thumbnails.clear()
+    placeholder_thumbs.clear()
     
     # Create the main plotting interface
     create_main_plot_interface()
 
+def query_screen_size():
+    """Return the primary monitor's (width, height) without opening a window when screeninfo is installed"""
+    try:
+        from screeninfo import get_monitors
+        monitors = get_monitors()
+        primary = next((m for m in monitors if getattr(m, 'is_primary', False)), monitors[0])
+        return primary.width, primary.height
+    except Exception:
+        # screeninfo missing or unable to enumerate monitors: ask Tk instead
+        root = tk.Tk()
+        try:
+            return root.winfo_screenwidth(), root.winfo_screenheight()
+        finally:
+            root.destroy()
+
 def create_main_plot_interface():
     """Create the main plotting interface with all the matplotlib components"""
     global fig, main_ax, controls_ax, thumb_container_ax, thumb_axes, current_image_idx, btn_help, nav_text, btn_website
     
     # Get screen size for dynamic sizing with error handling
     try:
-        root = tk.Tk()
-        screen_width = root.winfo_screenwidth()
-        screen_height = root.winfo_screenheight()
-        root.destroy()
+        if screen_size:
+            # Already measured by the welcome window; avoids spinning up a throwaway Tk interpreter
+            screen_width, screen_height = screen_size
+        else:
+            screen_width, screen_height = query_screen_size()
     except Exception as e:
         print(f"Warning: Could not get screen size: {e}")
         screen_width = 1920
@@ -2309,6 +2862,10 @@ def create_main_plot_interface():
             print(f"✗ Failed to create figure: {e2}")
             return False
     
+    # Progressive thumbnail loading hands finished background renders back to the GUI thread through this timer
+    thumbnail_timer[0] = fig.canvas.new_timer(interval=50)
+    thumbnail_timer[0].add_callback(drain_thumbnail_renders)
+    
     # Create GridSpec and axes
     try:
         gs = gridspec.GridSpec(3, 2, width_ratios=[5, 1], height_ratios=[10, 0, 3.5], wspace=0.15, hspace=0.1)
@@ -2331,11 +2888,12 @@ def create_main_plot_interface():
     
     # Create thumbnail axes
     thumb_axes = []
+    highlighted_thumb_idx[0] = None
     print("Creating thumbnail axes...")
     for i in range(len(image_ids)):
         try:
             ax = fig.add_axes([0, 0, 1, 1], frameon=True) # Initially place them off-screen
-            ax.imshow(thumbnails[i])
+            ax.set_visible(False)  # Image drawn by update_thumbnail_visibility once it's on screen
             ax.set_title(f'{image_ids[i]}', fontsize=8, y=-0.35)  # Consistent y offset for uniform padding
             ax.set_xticks([])
             ax.set_yticks([])
@@ -2354,7 +2912,7 @@ def create_main_plot_interface():
             except:
                 print(f"✗ Failed to create thumbnail axis {i}")
                 return False
-    print(f"✓ Created {len(thumbnails)} thumbnail axes")
+    print(f"✓ Created {len(thumb_axes)} thumbnail axes")
     
     # Add dataset progress text at the bottom
     try:
@@ -2437,7 +2995,6 @@ def create_main_plot_interface():
     except Exception as e:
         print(f"⚠ Could not create website button: {e}")
         btn_website = None
-        import traceback
         traceback.print_exc()
     
     print("✓ Keyboard navigation help text, help button, and website button creation completed")
@@ -2479,7 +3036,6 @@ def create_main_plot_interface():
         print(f"✗ Error during final initialization: {e}")
         print("Attempting to save error information...")
         try:
-            import traceback
             with open('plotter_error.log', 'w') as f:
                 f.write(f"Error: {e}\n")
                 f.write("Traceback:\n")
@@ -2928,7 +3484,6 @@ def handle_help_link_click(link_type, shortcut):
         elif link_type == 'website':
             # Open the website in the default browser
             try:
-                import webbrowser
                 webbrowser.open(shortcut)
                 show_help_tooltip("Opening website in your default browser...")
             except Exception as e:
@@ -2957,18 +3512,19 @@ def show_help_tooltip(message):
         def remove_tooltip():
             try:
                 tooltip_ax.remove()
-                fig.canvas.draw()
+                fig.canvas.draw_idle()
             except:
                 pass
         
-        # Schedule tooltip removal
-        import threading
-        import time
-        timer = threading.Timer(3.0, remove_tooltip)
+        # Schedule tooltip removal on a canvas timer so the artist is touched from the GUI thread
+        timer = fig.canvas.new_timer(interval=3000)
+        timer.single_shot = True
+        timer.add_callback(remove_tooltip)
         timer.start()
+        tooltip_ax.removal_timer = timer  # Keep the timer alive until it fires
         
         # Redraw to show tooltip
-        fig.canvas.draw()
+        fig.canvas.draw_idle()
         
     except Exception as e:
         print(f"⚠ Error showing help tooltip: {e}")
@@ -2988,7 +3544,6 @@ def on_website_button_click(event=None):
         
         print(f"🌐 Opening {website_name}: {website_url}")
         try:
-            import webbrowser
             webbrowser.open(website_url)
             print("✓ Website opened successfully")
         except Exception as e:
@@ -2996,7 +3551,6 @@ def on_website_button_click(event=None):
             
     except Exception as e:
         print(f"⚠ Error handling website button click: {e}")
-        import traceback
         traceback.print_exc()
 
 # Inline website links function removed - simplified to single link approach
@@ -3104,7 +3658,6 @@ def create_professional_icon_button(ax, icon_type='link', fallback_text='LINK'):
 def open_website_and_close(url, dialog):
     """Open website and close the dialog"""
     try:
-        import webbrowser
         webbrowser.open(url)
         print(f"🌐 Opening website: {url}")
         dialog.destroy()
@@ -3124,49 +3677,12 @@ def show_help_page():
             print(f"⚠ Error: {status}")
             return
         
-        # Create professional tabular help content with clickable links
-        help_content = """
-╔══════════════════════════════════════════════════════════════════════════════╗
-║                          KEYBOARD SHORTCUTS REFERENCE                        ║
-╠══════════════════════════════════════════════════════════════════════════════╣
-║  ┌────────────────────────────────────────────────────────────────────────┐  ║
-║  │                           NAVIGATION                                   │  ║
-║  ├────────────────────────────────────────────────────────────────────────┤  ║
-║  │  ← / → or A/D           │  Navigate to Previous/Next image             │  ║
-║  │  Home / End             │  Jump to First/Last image                    │  ║
-║  │  PageUp / PageDown      │  Jump ±10 images                             │  ║
-║  │  1-9                    │  Jump to specific image (1st-9th)            │  ║
-║  └────────────────────────────────────────────────────────────────────────┘  ║
-║  ┌────────────────────────────────────────────────────────────────────────┐  ║
-║  │                            ACTIONS                                     │  ║
-║  ├────────────────────────────────────────────────────────────────────────┤  ║
-║  │  R                      │  Reset annotation counter                    │  ║
-║  │  S                      │  Save annotations and data                   │  ║
-║  │  L                      │  Toggle hover labels on/off                  │  ║
-║  │  F                      │  Flip Y-axis orientation                     │  ║
-║  │  B                      │  Toggle background image (if enabled)        │  ║
-║  │  O or Enter/Return      │  Open current image in browser               │  ║
-║  └────────────────────────────────────────────────────────────────────────┘  ║
-║  ┌────────────────────────────────────────────────────────────────────────┐  ║
-║  │                        NATIVE OS SHORTCUTS                             │  ║
-║  ├────────────────────────────────────────────────────────────────────────┤  ║
-║  │  Ctrl+Z / Cmd+Z        │  Undo last annotation                         │  ║
-║  │  Ctrl+Y / Cmd+Y        │  Redo undone annotation                       │  ║
-║  │  Ctrl+S / Cmd+S        │  Save (same as S key)                         │  ║
-║  └────────────────────────────────────────────────────────────────────────┘  ║
-║  ┌────────────────────────────────────────────────────────────────────────┐  ║
-║  │                              NOTES                                     │  ║
-║  ├────────────────────────────────────────────────────────────────────────┤  ║
-║  │  • Press H, ?, or F1 to show this help again                           │  ║
-║  │  • Press ESC or click the ✕ button to close this help page             │  ║
-║  └────────────────────────────────────────────────────────────────────────┘  ║
-╚══════════════════════════════════════════════════════════════════════════════╝"""
-        
         # Create help text box in the main plot area with monospace font for table alignment
         if help_text_box and hasattr(help_text_box, 'set_text'):
             try:
                 # Update existing help text box
-                help_text_box.set_text(help_content)
+                if help_text_box.get_text() != HELP_CONTENT:
+                    help_text_box.set_text(HELP_CONTENT)
                 help_text_box.set_visible(True)
                 
                 # Ensure overlay is also visible
@@ -3183,7 +3699,7 @@ def show_help_page():
             try:
                 # Create new help text box with monospace font for proper table alignment
                 # Create help text box in figure coordinates for proper centering
-                help_text_box = fig.text(0.5, 0.5, help_content, 
+                help_text_box = fig.text(0.5, 0.5, HELP_CONTENT, 
                                         ha='center', va='center', fontsize=9,
                                         fontfamily='monospace',  # Use monospace for table alignment
                                         bbox=dict(facecolor='white', alpha=0.98, 
@@ -3212,7 +3728,7 @@ def show_help_page():
         try:
             help_text_box.set_visible(True)
             # Redraw the plot to show help
-            fig.canvas.draw()
+            fig.canvas.draw_idle()
             print("✓ Professional help page displayed successfully")
         except Exception as e:
             print(f"⚠ Error displaying help page: {e}")
@@ -3224,11 +3740,10 @@ def show_help_page():
             if not is_visible:
                 print("⚠ Warning: Help text should be visible but isn't - forcing visibility")
                 help_text_box.set_visible(True)
-                fig.canvas.draw()
+                fig.canvas.draw_idle()
         
     except Exception as e:
         print(f"⚠ Error in show_help_page: {e}")
-        import traceback
         traceback.print_exc()
 
 # hide_inline_website_links function removed - simplified to single link approach
@@ -3239,6 +3754,9 @@ def hide_help_page():
     
     try:
         if help_text_box and hasattr(help_text_box, 'set_visible'):
+            if not help_text_box.get_visible():
+                return  # Already hidden: nothing to repaint
+            
             # Hide the help text
             help_text_box.set_visible(False)
             
@@ -3249,7 +3767,7 @@ def hide_help_page():
             
             # Redraw the plot to hide help
             if 'fig' in globals() and fig is not None:
-                fig.canvas.draw()
+                fig.canvas.draw_idle()
                 print("✓ Help page hidden successfully")
             else:
                 print("⚠ Warning: Figure not available for redraw")
@@ -3257,7 +3775,6 @@ def hide_help_page():
             print("ℹ No help page to hide")
     except Exception as e:
         print(f"⚠ Error hiding help page: {e}")
-        import traceback
         traceback.print_exc()
 
 def connect_events():
@@ -3265,6 +3782,7 @@ def connect_events():
     # Connect all events to the main figure
     fig.canvas.mpl_connect('button_press_event', onclick_main)
     fig.canvas.mpl_connect('motion_notify_event', on_motion_main)
+    fig.canvas.mpl_connect('draw_event', on_draw_main)
     fig.canvas.mpl_connect('resize_event', on_resize)
     fig.canvas.mpl_connect('key_press_event', on_key_press)
     
@@ -3341,6 +3859,7 @@ def return_to_welcome(event=None):
 
 # --- Main execution ---
 if __name__ == "__main__":
+    setup_logging()
     try:
         # Start the main program loop
         logger.info("Starting Bounding Box Plotter application")
@@ -3351,19 +3870,22 @@ if __name__ == "__main__":
         print(f"Critical error: {e}")
         # Try to save error information
         try:
-            import traceback
             error_file = os.path.join(tempfile.gettempdir(), 'plotter_crash.log')
+            # Build the whole report in memory and write it with a single call
+            report = io.StringIO()
+            report.write(f"Plotter Crash Report\n")
+            report.write(f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+            report.write(f"Error: {e}\n")
+            report.write("Traceback:\n")
+            traceback.print_exc(file=report)
             with open(error_file, 'w') as f:
-                f.write(f"Plotter Crash Report\n")
-                f.write(f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write(f"Error: {e}\n")
-                f.write("Traceback:\n")
-                traceback.print_exc(file=f)
+                f.write(report.getvalue())
             print(f"Crash details saved to: {error_file}")
         except:
             pass
 else:
     # If imported as a module, just show welcome screen once
+    setup_logging()
     try:
         file_path = show_welcome_screen_and_get_filepath()
         if file_path:
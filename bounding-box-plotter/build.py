@@ -286,6 +286,38 @@ def build_python_package():
         print("✗ Failed to build Python package")
         return False
 
+def profile_imports(log_path='import.log', top=15):
+    """Record the application's import graph with -X importtime and list the slowest imports"""
+    print("⏱ Profiling startup imports...")
+    print("  Close the welcome window once it appears to finish the run")
+    
+    with open(log_path, 'w') as log_file:
+        subprocess.run([sys.executable, '-X', 'importtime', 'bounding_box_plotter.py'],
+                       stderr=log_file)
+    
+    # Lines look like: "import time:   self [us] | cumulative | imported package"
+    timings = []
+    with open(log_path) as log_file:
+        for line in log_file:
+            if not line.startswith('import time:') or 'cumulative' in line:
+                continue
+            try:
+                self_us, cumulative_us, name = line.split(':', 1)[1].split('|', 2)
+                timings.append((int(cumulative_us), int(self_us), name.strip()))
+            except ValueError:
+                continue
+    
+    if not timings:
+        print("✗ No import timings recorded")
+        return False
+    
+    timings.sort(reverse=True)
+    print(f"✓ Import log written to {log_path} (open with `tuna {log_path}` for a flame graph)")
+    print(f"  {'cumulative':>12}  {'self':>10}  module")
+    for cumulative_us, self_us, name in timings[:top]:
+        print(f"  {cumulative_us / 1000:>10.1f}ms  {self_us / 1000:>8.1f}ms  {name}")
+    return True
+
 def main():
     """Main build function"""
     parser = argparse.ArgumentParser(description='Build Bounding Box Plotter')
@@ -293,9 +325,14 @@ def main():
     parser.add_argument('--package', action='store_true', help='Build Python package')
     parser.add_argument('--installer', action='store_true', help='Create installer')
     parser.add_argument('--all', action='store_true', help='Build everything')
+    parser.add_argument('--profile-imports', action='store_true',
+                        help='Profile startup imports with -X importtime and exit')
     
     args = parser.parse_args()
     
+    if args.profile_imports:
+        return 0 if profile_imports() else 1
+    
     print("🚀 Bounding Box Plotter Build Script")
     print("=" * 50)
     
@@ -105,6 +105,13 @@ setup(
             "material-icons>=0.0.1",
             "feather-icons>=0.0.1",
         ],
+        "performance": [
+            "pyarrow>=7.0.0",
+            "pyvips>=2.1.0",
+            "numba>=0.56.0",
+            "rtree>=1.0.0",
+            "screeninfo>=0.8",
+        ],
     },
     entry_points={
         "console_scripts": [
@@ -0,0 +1,54 @@
+"""
+Tests for reading a CSV and saving it back out unchanged
+"""
+
+import pytest
+import sys
+import os
+import types
+
+import pandas as pd
+
+# Headless backend; the module is loaded without its entry point so no windows are opened
+os.environ.setdefault('MPLBACKEND', 'Agg')
+
+PLOTTER_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'bounding_box_plotter.py')
+
+CSV_TEXT = (
+    "image_id,x_min,x_max,y_min,y_max,label_date,label_id,marked\n"
+    "00123,10,40,20,50,2024-01-05,007,\n"
+    "00123,60,90,20,50,2024-01-05T10:00:00,010,yes\n"
+    "04560,10.5,40,,50,2023-12-31,000,\n"
+)
+
+@pytest.fixture(scope="module")
+def plotter():
+    """Load bounding_box_plotter up to its main execution block"""
+    with open(PLOTTER_PATH, encoding='utf-8') as f:
+        source = f.read().split('# --- Main execution ---')[0]
+    module = types.ModuleType('bounding_box_plotter')
+    module.__file__ = PLOTTER_PATH
+    sys.modules['bounding_box_plotter'] = module
+    exec(compile(source, PLOTTER_PATH, 'exec'), module.__dict__)
+    return module
+
+@pytest.mark.parametrize("use_pyarrow", [False, True])
+def test_labels_round_trip_unchanged(plotter, tmp_path, monkeypatch, use_pyarrow):
+    """Test that date-like and zero-padded values are written back exactly as read"""
+    if use_pyarrow:
+        if plotter.pa is None:
+            pytest.skip("pyarrow is not installed")
+    else:
+        monkeypatch.setattr(plotter, 'pa', None)
+
+    csv_path = tmp_path / 'input.csv'
+    csv_path.write_text(CSV_TEXT, encoding='utf-8')
+    assert plotter.process_csv_file(str(csv_path)) is not False
+    plotter.save_annotations()
+
+    original = pd.read_csv(csv_path, dtype=str, keep_default_na=False)
+    saved = pd.read_csv(os.path.join(plotter.output_dir, 'marked_skus.csv'), dtype=str, keep_default_na=False)
+    for col in ('image_id', 'label_date', 'label_id', 'marked'):
+        assert saved[col].tolist() == original[col].tolist()
+    assert plotter.df['x_min'].tolist() == [10, 60, 10.5]
+    assert plotter.df['y_min'].isna().tolist() == [False, False, True]